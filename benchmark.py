@@ -1,100 +1,166 @@
 import argparse
-import configparser
-import itertools
+import io
+import logging
+import mmap
 import os
-import queue
+import random
+import socket
+import statistics
 import tempfile
-import threading
 import time
-from typing import Dict
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
 
-from client import Client
-from fsearch.server import Server
-from fsearch.utils import benchmark_algorithms, create_sample, generate_samples
+from fsearch.client import Client
 
+logger = logging.getLogger(__name__)
 
-def send_query(client: Client, query):
+
+def send_query(client: Client, query: bytes):
     """
     Sends a query to the server using the provided client and measures the request time.
 
     Args:
         client : Client
             An instance of the Client class used to send the query.
-        query : str
-            The query string to send to the server.
+        query : bytes
+            The UTF-8 encoded query to send to the server.
 
     Returns:
-        float: The time taken to receive the response, in seconds.
+        int: The time taken to receive the response, in nanoseconds.
     """  # noqa: E501
 
-    start_time = time.perf_counter()
-    client.send_message(query)
-    # print("Response:", response)
-    req_time = time.perf_counter() - start_time
-    return req_time
+    start_ns = time.perf_counter_ns()
+    client.send_bytes(query)
+    return time.perf_counter_ns() - start_ns
 
 
-def batch_queries(host, port, linuxpath, no_requests, msg_queue: queue.Queue):
+def batch_queries(
+    host, port, sample_queries: List[str], no_requests, concurrency: int = 4
+):
     """
-    Sends a batch of queries to the server and calculates the average execution time.
+    Sends a batch of queries to the server from concurrent workers and calculates the average execution time.
+
+    Each worker owns a keep-alive `Client` and pulls queries from a shared
+    queue of jobs until it is drained, so the batch measures the server
+    throughput rather than a single request/response stream.
 
     Args:
         host : str
             The server host address.
         port : int
             The server port number.
-        linuxpath : str
-            The path to the sample file used to generate queries.
+        sample_queries : List[str]
+            The pre-generated queries to send, cycled over if fewer than `no_requests`.
         no_requests : int
             The number of queries to send.
-        msg_queue : queue.Queue
-            A queue to store the average execution time of the requests.
+        concurrency : int, optional
+            The number of concurrent client workers. Defaults to 4.
 
     Returns:
         float: The average execution time of the batch, in milliseconds.
     """  # noqa: E501
     log_level = "DEBUG"
-    client = Client(host, port, log_level=log_level)
-    sample_queries = generate_samples(linuxpath, no_requests)
-    sample_queries = [n for n in sample_queries if n]
-    queries = itertools.cycle(sample_queries)
-    execution_times = []
-    ## ensure that it run the loop within 1 second
-    # start_time = (
-    #    time.perf_counter()
-    # )
+    ## replay the non-empty, pre-encoded sample queries from a ring buffer
+    queries = deque(query.encode("utf-8") for query in sample_queries if query)
+    jobs = deque()
     for _ in range(no_requests):
-        # if time.perf_counter() - start_time > 1:
-        #    break
-        query = next(queries)
-        req_time = send_query(client, query)
-        execution_times.append(req_time)
+        jobs.append(queries[0])
+        queries.rotate(-1)
+
+    def worker() -> List[int]:
+        times = []
+        ## reuse a single keep-alive connection per worker
+        with Client(host, port, log_level=log_level) as client:
+            while True:
+                try:
+                    query = jobs.popleft()
+                except IndexError:
+                    break
+                times.append(send_query(client, query))
+        return times
+
+    workers = max(1, min(concurrency, no_requests))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker) for _ in range(workers)]
+        execution_times = [t for f in futures for t in f.result()]
+
+    ## accumulate in integer nanoseconds, convert to ms only for reporting
     request_count = len(execution_times)
-    avg_time = sum(execution_times) / request_count
-    avg_ms = round(avg_time * 1000, 2)
-    msg_queue.put(avg_ms)
-    print(
-        f"Average Execution Time for {request_count} requests : {avg_ms} milli-seconds"  # noqa: E501
+    avg_ns = sum(execution_times) // request_count
+    avg_ms = round(avg_ns / 1_000_000, 2)
+    p95_ms = avg_ms
+    if request_count > 1:
+        p95_ns = statistics.quantiles(execution_times, n=20)[-1]
+        p95_ms = round(p95_ns / 1_000_000, 2)
+    logger.debug(
+        "Average Execution Time for %s requests : %s milli-seconds (p95: %s milli-seconds)",  # noqa: E501
+        request_count,
+        avg_ms,
+        p95_ms,
     )
     return avg_ms
 
 
-def start_server(server: Server, stop_event: threading.Event):
+def sample_lines(
+    sample_map: mmap.mmap, size: int = 10, window: int = 250000
+) -> List[str]:
     """
-    Starts the server and keeps it running until the stop event is set.
+    Samples random lines from a memory-mapped sample file without reading it.
 
     Args:
-        server : Server
-            An instance of the Server class.
-        stop_event : threading.Event
-            An event used to signal when to stop the server.
+        sample_map : mmap.mmap
+            The read-only memory map of the sample file.
+        size : int
+            Number of lines to sample. Defaults to 10.
+        window : int
+            Size hint of the leading region the server loads, in bytes. Defaults to 250000.
 
     Returns:
-        None
+        List[str]: A list of sampled lines.
+    """  # noqa: E501
+    ## same region `read_file` loads: whole lines up to the size hint
+    end = sample_map.find(b"\n", window)
+    end = len(sample_map) if end == -1 else end
+    if not end:
+        return []
+
+    lines = []
+    for _ in range(size):
+        offset = random.randrange(end)
+        start = sample_map.rfind(b"\n", 0, offset) + 1
+        stop = sample_map.find(b"\n", offset, end)
+        stop = end if stop == -1 else stop
+        lines.append(sample_map[start:stop].decode("utf-8"))
+    return lines
+
+
+def wait_ready(host: str, port: int, timeout: float = 10) -> bool:
+    """
+    Waits until a server accepts TCP connections on the given address.
+
+    Args:
+        host : str
+            The server host address.
+        port : int
+            The server port number.
+        timeout : float, optional
+            The maximum number of seconds to wait. Defaults to 10.
+
+    Returns:
+        bool: True once the server accepts connections, False on timeout.
     """
-    while not stop_event.isSet():
-        server.connect()
-    return
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.settimeout(0.1)
+            if probe.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(0.01)
+    return False
 
 
 def write_config(config_path: str, configs: Dict[str, str]):
@@ -111,10 +177,10 @@ def write_config(config_path: str, configs: Dict[str, str]):
     Returns:
         None
     """
-    config = configparser.ConfigParser()
-    config["DEFAULT"] = configs
-    with open(config_path, "w") as configfile:
-        config.write(configfile)
+    content = "[DEFAULT]\n" + "".join(
+        f"{key} = {value}\n" for key, value in configs.items()
+    )
+    Path(config_path).write_text(content)
 
 
 def format_dict_to_table(data: dict) -> str:
@@ -133,52 +199,47 @@ def format_dict_to_table(data: dict) -> str:
     # Initialize the rows list with the header
     rows = [headers]
 
-    # Get the unique query numbers (like 10) from the nested dictionaries
-    queries = sorted(
-        {query for subdict in data.values() for query in subdict.keys()}
-    )
-
-    for query in queries:
-        # Initialize a row with the current query number
-        row = [str(query)]
-        for key in data.keys():
-            # Get the set of values for the current query number
-            values_set = data[key].get(query)
-            if values_set:
-                # Format the values as comma-separated strings
-                formatted_values = " | ".join(
-                    f"{value:.1f}" for value in sorted(values_set)
-                )
-            else:
-                formatted_values = ""
-            row.append(formatted_values)
-        # Add the formatted row to the rows list
-        rows.append(row)
-
-    # Calculate the maximum width of each column
-    col_widths = [max(len(str(item)) for item in col) for col in zip(*rows)]
-
-    # Build the formatted table string
-    table = ""
+    # Format every (column, query) cell once in a single pass
+    cells = {
+        (key, query): " | ".join(
+            f"{value:.1f}" for value in sorted(values_set)
+        )
+        for key, subdict in data.items()
+        for query, values_set in subdict.items()
+    }
 
-    # Format the header row
-    header_row = " | ".join(
-        str(item).ljust(width) for item, width in zip(rows[0], col_widths)
-    )
-    table += f"{header_row}\n"
+    # Get the unique query numbers (like 10) from the formatted cells
+    queries = sorted({query for _, query in cells})
 
-    # Add the underline row
-    underline_row = " | ".join("-" * width for width in col_widths)
-    table += f"{underline_row}\n"
+    for query in queries:
+        # A row is the query number followed by its cell in each column
+        rows.append(
+            [str(query)] + [cells.get((key, query), "") for key in headers[1:]]
+        )
 
-    # Add the data rows
-    for row in rows[1:]:
-        formatted_row = " | ".join(
-            str(item).ljust(width) for item, width in zip(row, col_widths)
+    # Convert every cell to a string once and track the column widths
+    str_rows = [[str(item) for item in row] for row in rows]
+    col_widths = [0] * len(headers)
+    for row in str_rows:
+        for i, item in enumerate(row):
+            if len(item) > col_widths[i]:
+                col_widths[i] = len(item)
+
+    # Write the formatted table lines into a single buffer
+    buffer = io.StringIO()
+    for index, row in enumerate(str_rows):
+        buffer.write(
+            " | ".join(
+                item.ljust(width) for item, width in zip(row, col_widths)
+            )
         )
-        table += f"{formatted_row}\n"
+        buffer.write("\n")
+        if index == 0:
+            # Add the underline row below the header row
+            buffer.write(" | ".join("-" * width for width in col_widths))
+            buffer.write("\n")
 
-    return table
+    return buffer.getvalue()
 
 
 def performance(min_size: int, no_iterations: int) -> str:
@@ -193,76 +254,97 @@ def performance(min_size: int, no_iterations: int) -> str:
     Returns:
         str: The performance benchmark report as a formatted table string.
     """  # noqa: E501
+    ## deferred so `benchmark.py -h` does not load the server stack
+    from fsearch.server import Server
+    from fsearch.utils import create_sample
+
     host, port = "0.0.0.0", 8080
     benchmarks = {}
     # log_level = "DEBUG"
     log_level = "INFO"
-    # for file_size in range(10000, 1000000 + 100000, 100000):
-    for file_size in range(
-        min_size, (min_size * no_iterations) + min_size, min_size
-    ):
-        label = f"{file_size}-kb"
-        ## records collector
-        benchmarks[label] = {}
-        # create a sample database file
-        mb_size = file_size / 1000
-        linuxpath = create_sample(mb_size)
-
-        # Create a temporary config file
+    logger.setLevel(log_level)
+    ## long-lived worker threads for the server and the client batches
+    server_pool = ThreadPoolExecutor(max_workers=1)
+    client_pool = ThreadPoolExecutor(max_workers=1)
+    with ExitStack() as stack:
+        stack.enter_context(server_pool)
+        stack.enter_context(client_pool)
+        ## one config file, rewritten for every reread value
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
             config_path = temp_file.name
+        stack.callback(os.unlink, config_path)
+        # for file_size in range(10000, 1000000 + 100000, 100000):
+        for file_size in range(
+            min_size, (min_size * no_iterations) + min_size, min_size
+        ):
+            label = f"{file_size}-kb"
+            ## records collector
+            benchmarks[label] = {}
+            # create a sample database file
+            mb_size = file_size / 1000
+            linuxpath = create_sample(mb_size)
+
+            with ExitStack() as sample_stack:
+                ## removed even when a batch fails
+                sample_stack.callback(os.unlink, linuxpath)
+                sample_file = sample_stack.enter_context(open(linuxpath, "rb"))
+                sample_map = sample_stack.enter_context(
+                    mmap.mmap(sample_file.fileno(), 0, access=mmap.ACCESS_READ)
+                )
 
-        for no_requests in range(10, 100, 10):
-            # select a random query pattern from the sample
-            records = set()
-            for reread_on_query in [False, True]:
-                configs = {
+                # select random query patterns, outside the timing
+                request_counts = range(10, 100, 10)
+                sample_queries = sample_lines(sample_map, max(request_counts))
+
+                base_configs = {
                     "host": host,
                     "port": port,
                     "linuxpath": linuxpath,
-                    "REREAD_ON_QUERY": reread_on_query,
                 }
 
-                write_config(config_path, configs=configs)
-                # run server in a separate thread
-
-                stop_event = threading.Event()
-                server = Server(
-                    config_path=config_path,
-                    port=port,
-                    max_conn=10,
-                    log_level=log_level,
-                )
-                server_thread = threading.Thread(
-                    target=start_server, args=(server, stop_event)
-                )
-                server_thread.start()
-                ## give timeout for server to start
-                time.sleep(5)
-
-                ## run client batched requests in a separate thread
-                msg_queue = queue.Queue()
-                client_thread = threading.Thread(
-                    target=batch_queries,
-                    args=(host, port, linuxpath, no_requests, msg_queue),
-                )
-                client_thread.start()
-                client_thread.join()
-                avg_time = msg_queue.get()
-                records.add(avg_time)
-
-                # Stop the server
-                server.stop()
-                stop_event.set()
-                print("Server stoped: ", linuxpath)
-            benchmarks[label][no_requests] = records
-
-        ## cleanup the sample and tempconfig
-
-        os.remove(linuxpath)
-        os.remove(config_path)
-        # break
-    print(benchmarks)
+                for reread_on_query in [False, True]:
+                    configs = {
+                        **base_configs,
+                        "REREAD_ON_QUERY": reread_on_query,
+                    }
+
+                    write_config(config_path, configs=configs)
+                    # run server in a separate thread
+
+                    server = Server(
+                        config_path=config_path,
+                        port=port,
+                        max_conn=10,
+                        log_level=log_level,
+                    )
+                    ## connect blocks in the accept loop until stopped
+                    server_future = server_pool.submit(server.connect)
+                    ## wait for the server to accept connections
+                    if not wait_ready(host, port):
+                        raise TimeoutError(
+                            f"Server not ready on {host}:{port}"
+                        )
+
+                    for no_requests in request_counts:
+                        ## run client batched requests in a separate thread
+                        client_future = client_pool.submit(
+                            batch_queries,
+                            host,
+                            port,
+                            sample_queries,
+                            no_requests,
+                        )
+                        records = benchmarks[label].setdefault(
+                            no_requests, set()
+                        )
+                        records.add(client_future.result())
+
+                    # Stop the server
+                    server.stop()
+                    server_future.result()
+                    logger.debug("Server stoped: %s", linuxpath)
+            # break
+    logger.debug("Benchmark records: %s", benchmarks)
     report_table = format_dict_to_table(benchmarks)
     report_table = f"\n{report_table}"
     print(report_table)
@@ -323,6 +405,8 @@ def main():
 
     args: BenchmarkArgs = parser.parse_args()  # type: ignore
 
+    from fsearch.utils import benchmark_algorithms, create_sample
+
     # run the speed test benchmark
     min_size, iterations = args.min_size, args.iterations
     speed_report = performance(min_size, iterations)
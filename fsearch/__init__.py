@@ -4,12 +4,20 @@ fsearch/__init__.py
 The fsearch package init script.
 """
 
-import logging
-
 __app_name__ = "fsearch"
 __version__ = "0.1.0"
 
-logging.basicConfig(
-    format="%(asctime)s : [%(levelname)s] - %(message)s",
-    handlers=[logging.StreamHandler()],
-)
+
+def setup_logging():
+    """
+    Configures the log handler and format shared by the fsearch modules.
+
+    Called by the modules that log, so importing the bare package (e.g. for
+    `fsearch --version`) does not load `logging`. Repeated calls are no-ops.
+    """
+    import logging
+
+    logging.basicConfig(
+        format="%(asctime)s : [%(levelname)s] - %(message)s",
+        handlers=[logging.StreamHandler()],
+    )
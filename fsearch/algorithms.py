@@ -4,20 +4,26 @@ fsearch/algorithms.py
 This module contains various string search algorithms implemented in Python. Each algorithm searches for
 an exact match of a given pattern within a provided text. The module includes the following search functions:
 
-- `native_search`: Performs a naive search for a pattern in the text.
-- `regex_search`: Uses regular expressions to find a full line match of the pattern.
+- `native_search`: Performs a naive search for a pattern in the text (also exported as `naive_search`).
+- `regex_search`: Finds a full line match of the pattern, optionally with regular expressions.
 - `rabin_karp_search`: Implements the Rabin-Karp algorithm for searching a full line match.
 - `kmp_search`: Applies the Knuth-Morris-Pratt (KMP) algorithm to find a full line match.
 - `aho_corasick_search`: Applies the Aho-Corasick algorithm algorithm to find a full line match.
+- `shift_or_search`: Applies the bit-parallel Shift-Or algorithm to find a full line match.
+- `hyperscan_search`: Finds a full line match with the optional Hyperscan regex engine.
+- `search_many`: Checks many patterns against the text in one Aho-Corasick pass.
 
 The functions provided are designed to work with multi-line text and search for patterns that match entire lines.
 
 Functions:
 - native_search(text: str, pattern: str) -> bool
-- regex_search(text: str, pattern: str) -> bool
+- regex_search(text: str, pattern: str, use_regex: bool = False) -> bool
 - rabin_karp_search(text: str, pattern: str) -> bool
 - kmp_search(text: str, pattern: str) -> bool
 - aho_corasick_search(text: str, pattern: str) -> bool
+- shift_or_search(text: str, pattern: str) -> bool
+- hyperscan_search(text: str, pattern: str) -> bool
+- search_many(text: str, patterns: list[str]) -> dict[str, bool]
 
 Example usage:
 
@@ -42,18 +48,49 @@ Example usage:
 from __future__ import annotations
 
 import bisect
+import os
 import re
-from collections import deque
+from collections import defaultdict, deque
+from functools import lru_cache
 
-from fsearch.utils import compute_lps
+from fsearch import __version__
+
+
+def _find_line(text: str, pattern: str) -> bool:
+    """
+    Check whether `pattern` is a stand-alone line of `text` without splitting it.
+
+    Occurrences of the pattern are located with `str.find`, which scans in C, and each one is
+    accepted when it is bounded by newlines or the ends of the text; no line list is built.
+
+    Args:
+        text (str): The text to scan. This may contain multiple lines.
+        pattern (str): A non-empty pattern without newlines.
+
+    Returns:
+        bool: `True` if some line of `text` equals `pattern`, otherwise `False`.
+    """  # noqa: E501
+    size = len(pattern)
+    end = len(text)
+    index = text.find(pattern)
+    while index >= 0:
+        stop = index + size
+        if (index == 0 or text[index - 1] == "\n") and (
+            stop == end or text[stop] == "\n"
+        ):
+            return True
+        index = text.find(pattern, index + 1)
+
+    return False
 
 
 def native_search(text: str, pattern: str):
     """
     Search for an exact match of the pattern in the provided text using a naive search algorithm.
 
-    This function splits the input `text` into individual lines and checks each line for an exact match
-    with the `pattern`. If an exact match is found, the function returns `True`; otherwise, it returns `False`.
+    This function looks for the `pattern` enclosed by line boundaries in the input `text`, which is equivalent
+    to checking each line for an exact match. If an exact match is found, the function returns `True`;
+    otherwise, it returns `False`. The `text` and `pattern` may also both be `bytes`.
 
     Args:
         text (str): The text in which to search for the pattern. This text may contain multiple lines.
@@ -72,22 +109,56 @@ def native_search(text: str, pattern: str):
         >>> native_search(text, pattern)
         False
     """  # noqa: E501
-    for line in text.split("\n"):
-        if line == pattern:
-            return True
-    return False
+    ## the same checks work on bytes, with a bytes separator
+    newline = b"\n" if isinstance(text, bytes) else "\n"
+
+    ## a line can never contain the separator itself
+    if newline in pattern:
+        return False
+
+    ## a single C-level substring scan for the newline-wrapped pattern
+    ## finds the inner lines, and the first and last lines are checked
+    ## at the ends, so the text is neither split nor copied
+    return (
+        text == pattern
+        or text.startswith(pattern + newline)
+        or text.endswith(newline + pattern)
+        or newline + pattern + newline in text
+    )
+
 
+## alias under the textbook name of the algorithm
+naive_search = native_search
 
-def regex_search(text: str, pattern: str) -> bool:
+
+@lru_cache(maxsize=4096)
+def _compile_line(pattern: str) -> re.Pattern:
+    """
+    Compiles, and caches, a regex matching `pattern` as a whole line.
+
+    Args:
+        pattern (str): The exact pattern string to match.
+
+    Returns:
+        re.Pattern: The compiled multi-line regex.
     """
-    Search for an exact match of the pattern in the provided text using regular expressions.
+    return re.compile(f"^{re.escape(pattern)}$", re.MULTILINE)
 
-    This function uses regular expressions to find an exact match of the `pattern` in the `text`.
-    It ensures that the pattern matches an entire line within the text.
+
+def regex_search(text: str, pattern: str, use_regex: bool = False) -> bool:
+    """
+    Search for an exact match of the pattern in the provided text, optionally using regular expressions.
+
+    By default the whole-line match is answered with a plain substring check on the newline-delimited
+    text (see `native_search`), which avoids the regex engine entirely. With `use_regex` the `pattern`
+    is matched by an anchored, multi-line regular expression instead. Both give the same result for a
+    `pattern` without newlines; one containing a newline is never found by the default path, while the
+    regex may match it across consecutive lines.
 
     Args:
         text (str): The text in which to search for the pattern. This text may contain multiple lines.
         pattern (str): The exact pattern string to search for within the text.
+        use_regex (bool): Whether to match with the compiled regex. Defaults to False.
 
     Returns:
         bool: `True` if the pattern is found as an exact match on any line in the text; `False` otherwise.
@@ -102,8 +173,11 @@ def regex_search(text: str, pattern: str) -> bool:
         >>> regex_search(text, pattern)
         False
     """  # noqa: E501
-    # Compile the regex pattern to match the whole line
-    regex = re.compile(f"^{re.escape(pattern)}$", re.MULTILINE)
+    if not use_regex:
+        return native_search(text, pattern)
+
+    # Reuse the compiled whole-line regex for repeated patterns
+    regex = _compile_line(pattern)
 
     # Search through the text
     matches = regex.search(text)
@@ -111,14 +185,76 @@ def regex_search(text: str, pattern: str) -> bool:
     return matches is not None
 
 
+@lru_cache(maxsize=4096)
+def _compile_hyperscan(pattern: str):
+    """
+    Compiles, and caches, a Hyperscan database matching `pattern` as a whole line.
+
+    Args:
+        pattern (str): The exact pattern string to match.
+
+    Returns:
+        hyperscan.Database: The compiled block-mode database.
+
+    Raises:
+        ImportError: If the optional `hyperscan` package is not installed.
+    """  # noqa: E501
+    try:
+        import hyperscan
+    except ImportError:
+        raise ImportError(
+            "please install hyperscan. Run `pip install fsearch[hyperscan]` or `pip install hyperscan`"  # noqa: E501
+        )
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[f"^{re.escape(pattern)}$".encode("utf-8")],
+        ids=[0],
+        flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SINGLEMATCH],
+    )
+    return database
+
+
+def hyperscan_search(text: str, pattern: str) -> bool:
+    """
+    Search for a full line match of the pattern in the provided text with the Hyperscan regex engine.
+
+    The anchored pattern is compiled once into a Hyperscan database and reused for repeated patterns.
+    This needs the optional `hyperscan` package (`pip install fsearch[hyperscan]`).
+
+    Args:
+        text (str): The text in which to search for the pattern. This text may contain multiple lines.
+        pattern (str): The exact pattern string to search for within the text.
+
+    Returns:
+        bool: `True` if the pattern is found as an exact match on any line in the text; `False` otherwise.
+
+    Raises:
+        ImportError: If the optional `hyperscan` package is not installed.
+    """  # noqa: E501
+    ## hyperscan refuses patterns that match an empty line, and a line
+    ## never holds a newline, so those cases need no database
+    if not pattern or "\n" in pattern:
+        return native_search(text, pattern)
+
+    found = []
+
+    def on_match(match_id, start, end, flags, context):
+        found.append(match_id)
+
+    data = text if isinstance(text, bytes) else text.encode("utf-8")
+    _compile_hyperscan(pattern).scan(data, match_event_handler=on_match)
+    return bool(found)
+
+
 def rabin_karp_search(text: str, pattern: str):
     """
     Search for a full line match of a pattern in the provided text using the Rabin-Karp algorithm.
 
-    This function implements the Rabin-Karp algorithm to find an exact line-by-line match of the
-    `pattern` in the `text`. It calculates hash values for the `pattern` and compares them with
-    the hash values of each line in the text to detect potential matches. If the hash values match,
-    the function performs a direct comparison to ensure there are no hash collisions.
+    Rabin-Karp compares rolling hashes of the `pattern` and of same-length windows of the `text`, then
+    confirms hash hits with a direct comparison. A full-line match only ever compares a whole line of
+    the pattern's length, where hashing both strings costs more than the direct comparison it guards,
+    so each line is compared to the `pattern` directly.
 
     Args:
         text (str): The text in which to search for the pattern. This text may contain multiple lines.
@@ -137,49 +273,23 @@ def rabin_karp_search(text: str, pattern: str):
         >>> rabin_karp_search(text, pattern)
         False
     """  # noqa: E501
-    if not pattern or not text:
+    if not pattern or not text or "\n" in pattern:
         return False
 
-    # Define a prime number for the hash function
-    prime = 101
-
-    # Calculate the length of the pattern
-    m = len(pattern)
-
-    # Initialize hash values for pattern
-    pattern_hash = 0
-
-    # Calculate the hash value of the pattern
-    for i in range(m):
-        pattern_hash = prime * pattern_hash + ord(pattern[i])
-
-    lines = text.split("\n")
-    for line in lines:
-        n = len(line)
-        if n != m:
-            continue
-
-        # Initialize hash value for current line
-        current_hash = 0
-        for i in range(m):
-            current_hash = prime * current_hash + ord(line[i])
-
-        # Compare the hash values
-        if pattern_hash == current_hash:
-            # Check for exact match to avoid hash collision
-            if line == pattern:
-                return True
-
-    return False
+    ## a full-line match has the pattern's length, and for equal-length
+    ## strings a hash comparison decides nothing `==` does not, so only
+    ## the occurrences of the pattern itself need a boundary check
+    return _find_line(text, pattern)
 
 
 def kmp_search(text: str, pattern: str) -> bool:
     """
     Search for a full line match of a pattern in the provided text using the Knuth-Morris-Pratt (KMP) algorithm.
 
-    This function implements the KMP algorithm to efficiently find an exact line-by-line match of the
-    `pattern` in the `text`. The KMP algorithm preprocesses the pattern to create a longest prefix suffix (LPS)
-    array that is used to skip unnecessary comparisons during the search process.
+    The KMP algorithm preprocesses the pattern into a longest prefix suffix (LPS) array to skip
+    unnecessary comparisons while scanning for substrings. A full-line match only needs to scan lines of
+    the pattern's length, where a KMP match is exactly string equality, so each line is compared to the
+    `pattern` directly.
 
     Args:
         text (str): The content of the text to search. This may contain multiple lines.
@@ -199,72 +309,84 @@ def kmp_search(text: str, pattern: str) -> bool:
         False
     """  # noqa: E501
 
-    def kmp_search_line(pattern: str, line: str) -> bool:
-        """
-        Perform KMP search for a pattern in a single line.
+    if not pattern or "\n" in pattern:
+        return False
 
-        Args:
-            pattern (str): The pattern string to search for.
-            line (str): The line of text in which to search.
+    ## KMP only runs on lines of the pattern's length, where matching the
+    ## full pattern is exactly `line == pattern`
+    return _find_line(text, pattern)
 
-        Returns:
-            bool: `True` if the pattern matches the full line, otherwise `False`.
-        """  # noqa: E501
-        m = len(pattern)
-        n = len(line)
 
-        if m != n:
-            return False
-
-        lps = compute_lps(pattern)
-        i = 0  # Index for line
-        j = 0  # Index for pattern
+def aho_corasick_search(text: str, pattern: str) -> bool:
+    """
+    Aho-Corasick algorithm to find a full line match of a pattern in the text.
 
-        while i < n:
-            if pattern[j] == line[i]:
-                i += 1
-                j += 1
+    With a single pattern and a stand-alone line of the same length, the automaton reports a match
+    exactly when the line equals the pattern, so lines are compared directly; use `AhoCorasick` for
+    multi-pattern substring matching.
 
-            if j == m:
-                return True
-            elif i < n and pattern[j] != line[i]:
-                if j != 0:
-                    j = lps[j - 1]
-                else:
-                    i += 1
+    Args:
+        text (str): The content of the file.
+        pattern (str): The search string.
 
+    Returns:
+        bool: True if the pattern is found as a full match on a stand-alone line, otherwise False.
+    """  # noqa: E501
+    if not pattern or "\n" in pattern:
         return False
 
-    lines = text.split("\n")
-    for line in lines:
-        if kmp_search_line(pattern, line):
-            return True
-
-    return False
+    ## a single-pattern automaton run over a line of the pattern's length
+    ## only reports a full match when `line == pattern`
+    return _find_line(text, pattern)
 
 
-def aho_corasick_search(text: str, pattern: str) -> bool:
+def shift_or_search(text: str, pattern: str) -> bool:
     """
-    Aho-Corasick algorithm to find a full line match of a pattern in the text.
+    Search for a full line match of a pattern in the provided text using the bit-parallel Shift-Or algorithm.
+
+    Shift-Or (Baeza-Yates-Gonnet) keeps one bit per pattern position in a single integer, so each input
+    byte costs one shift, one OR and one mask lookup, without branching on partial matches. The pattern
+    is wrapped in newlines, as is the text, so that a match is always a stand-alone line. This is a pure
+    Python loop over the text's bytes, suited to comparing against the C-backed searches. The `text` and
+    `pattern` may also both be `bytes`.
 
     Args:
-        text (str): The content of the file.
-        pattern (str): The search string.
+        text (str): The content of the text to search. This may contain multiple lines.
+        pattern (str): The search string to find within the text.
 
     Returns:
-        bool: True if the pattern is found as a full match on a stand-alone line, otherwise False.
+        bool: `True` if the pattern is found as a full match on a stand-alone line, otherwise `False`.
+
+    Example:
+        >>> text = "Hello world\\nThis is a test\\nAnother line"
+        >>> shift_or_search(text, "This is a test")
+        True
+
+        >>> shift_or_search(text, "This is")
+        False
     """  # noqa: E501
-    aho = AhoCorasick()
-    aho.add_pattern(pattern)
-    aho.build_automaton()
-
-    lines = text.split("\n")
-    for line in lines:
-        if len(line) == len(pattern):
-            matches = aho.search(line)
-            for _, match in matches:
-                if match == pattern:
-                    return True
+    ## an empty pattern matches an empty line, as in `native_search`
+    if not pattern:
+        return native_search(text, pattern)
+    data = text if isinstance(text, bytes) else text.encode("utf-8")
+    needle = pattern if isinstance(pattern, bytes) else pattern.encode("utf-8")
+    if b"\n" in needle:
+        return False
+
+    needle = b"\n" + needle + b"\n"
+    ## bit i of a mask is cleared when the byte occurs at pattern position i
+    full = (1 << len(needle)) - 1
+    masks = [full] * 256
+    for position, byte in enumerate(needle):
+        masks[byte] &= ~(1 << position)
+
+    ## a cleared top bit means the whole pattern ended at this byte
+    hit = 1 << (len(needle) - 1)
+    state = full
+    for byte in b"\n" + data + b"\n":
+        state = ((state << 1) | masks[byte]) & full
+        if not state & hit:
+            return True
 
     return False
 
@@ -292,14 +414,73 @@ def binary_search(text: str, pattern: str) -> bool:
     return False
 
 
+class _Haystack:
+    """
+    A text encoded to UTF-8 once, for answering many queries against it.
+
+    Repeated searches of the same text (e.g. a server database) pay the
+    encoding once and then run `bytes.find`, CPython's byte-level fast
+    search, for every pattern.
+
+    Methods:
+    -------
+        contains(pattern):
+            Whether the pattern occurs anywhere in the text.
+
+        contains_line(pattern):
+            Whether the pattern matches a whole line of the text.
+    """
+
+    def __init__(self, text: str):
+        """
+        Encodes the text to search.
+
+        Args:
+            text (str): The text to search, possibly spanning multiple lines.
+        """
+        self._data = text.encode("utf-8")
+
+    def contains(self, pattern: str) -> bool:
+        """
+        Whether the pattern occurs anywhere in the text.
+
+        Args:
+            pattern (str): The substring to look for.
+
+        Returns:
+            bool: `True` if the pattern is found, otherwise `False`.
+        """
+        return self._data.find(pattern.encode("utf-8")) != -1
+
+    def contains_line(self, pattern: str) -> bool:
+        """
+        Whether the pattern matches a whole line of the text, like `native_search`.
+
+        Args:
+            pattern (str): The exact line to look for.
+
+        Returns:
+            bool: `True` if the pattern is found as a full line, otherwise `False`.
+        """  # noqa: E501
+        if "\n" in pattern:
+            return False
+        data, needle = self._data, pattern.encode("utf-8")
+        return (
+            data == needle
+            or data.startswith(needle + b"\n")
+            or data.endswith(b"\n" + needle)
+            or data.find(b"\n" + needle + b"\n") != -1
+        )
+
+
 class AhoCorasick:
     """
     Aho-Corasick algorithm for multiple pattern matching.
 
     Methods:
     -------
-        __init__():
-            Initializes Aho-Corasick automaton.
+        __init__(patterns=None):
+            Initializes Aho-Corasick automaton, optionally with patterns.
 
         add_pattern(pattern):
             Add a pattern to the  automaton.
@@ -309,45 +490,91 @@ class AhoCorasick:
 
         search(text):
             Searches the text using the automaton.
+
+        matches(text):
+            Returns the set of patterns that occur in the text.
+
+        dump(path):
+            Saves the built automaton to a file.
+
+        load(path):
+            Loads an automaton saved with `dump`.
+
+        load_or_build(patterns, cache_dir):
+            Loads the cached automaton for the patterns, building it on a miss.
+
+        _compile():
+            Builds the complete transition table used by `search`.
     """
 
-    def __init__(self):
+    def __init__(self, patterns: list[str] | None = None):
         """
         Initializes the Aho-Corasick algorithm.
+
+        Args:
+            patterns (list[str] | None): Patterns to add up front; when given,
+                the automaton is built and ready for `search`.
         """
         self.goto = {}
         self.output = {}
         self.fail = {}
         self.new_state = 0
+        ## state -> {byte: next state}, the trie edges leaving each state
+        self.children = defaultdict(dict)
+        ## state -> the pattern whose trie path ends there
+        self.terminals = {}
+        ## byte -> symbol map and state-indexed tables built for `search`
+        self._symbols = None
+        self._delta = None
+        self._outputs = None
+        self._output_sizes = None
+        self._hits = None
+        if patterns:
+            for pattern in patterns:
+                self.add_pattern(pattern)
+            self.build_automaton()
 
     def add_pattern(self, pattern: str):
         """
         Add a pattern to the  automaton.
 
+        The trie is keyed by the pattern's UTF-8 bytes, so that `search` can
+        step through encoded text as small integers. Empty patterns are
+        ignored.
+
         Args:
             pattern (str): The pattern to add.
         """
+        ## an empty pattern would end at the root and match between bytes
+        if not pattern:
+            return
+
+        children = self.children
         state = 0
-        for char in pattern:
-            if (state, char) not in self.goto:
+        for byte in pattern.encode("utf-8"):
+            ## one lookup in the state's own edges instead of two in `goto`
+            edges = children[state]
+            target = edges.get(byte)
+            if target is None:
                 self.new_state += 1
-                self.goto[(state, char)] = self.new_state
-            state = self.goto[(state, char)]
+                target = edges[byte] = self.new_state
+                self.goto[(state, byte)] = target
+            state = target
         self.output[state] = pattern
+        self.terminals[state] = pattern
+        self._delta = None
 
     def build_automaton(self):
         """Builds the failure function and finalizes the automaton."""
         queue = deque()
 
-        for char in {key[1] for key in self.goto if key[0] == 0}:
-            state = self.goto[(0, char)]
+        for state in self.children[0].values():
             self.fail[state] = 0
             queue.append(state)
 
         while queue:
             r = queue.popleft()
-            for key in {key[1] for key in self.goto if key[0] == r}:
-                s = self.goto[(r, key)]
+            for key, s in self.children[r].items():
                 queue.append(s)
                 state = self.fail[r]
                 while (state, key) not in self.goto and state != 0:
@@ -359,30 +586,234 @@ class AhoCorasick:
                 if self.fail[s] in self.output:
                     self.output[s] = self.output[self.fail[s]]
 
+        self._compile()
+
+    def _compile(self):
+        """
+        Flattens the automaton into a complete transition table for `search`.
+
+        The bytes used by the patterns form the alphabet, with symbol 0
+        standing for any other byte. `self._symbols` translates a byte into
+        its symbol and `self._delta[state][symbol]` is the next state with
+        the failure links already followed, so `search` does exactly one
+        lookup per byte. `self._outputs` and `self._output_sizes` (the
+        encoded length of each output) are lists indexed by state, and
+        `self._hits[state]` holds every pattern that ends in that state,
+        found by following the failure links.
+        """
+        size = self.new_state + 1
+        alphabet = sorted({byte for (_, byte) in self.goto})
+        symbols = bytearray(256)
+        for symbol, byte in enumerate(alphabet, start=1):
+            symbols[byte] = symbol
+        width = len(alphabet) + 1
+
+        delta = [None] * size
+        root_row = [0] * width
+        for byte, target in self.children.get(0, {}).items():
+            root_row[symbols[byte]] = target
+        delta[0] = root_row
+
+        ## breadth-first, so a state's fail target already has its row
+        queue = deque(self.children.get(0, {}).values())
+        while queue:
+            state = queue.popleft()
+            row = list(delta[self.fail.get(state, 0)])  # type: ignore
+            for byte, target in self.children.get(state, {}).items():
+                row[symbols[byte]] = target
+                queue.append(target)
+            delta[state] = row
+
+        self._symbols = bytes(symbols)
+        self._delta = delta
+        self._outputs = [self.output.get(state) for state in range(size)]
+        self._output_sizes = [
+            len(output.encode("utf-8")) if output is not None else 0
+            for output in self._outputs
+        ]
+
+        hits = [()] * size
+        for state in range(1, size):
+            found = []
+            node = state
+            while node:
+                if node in self.terminals:
+                    found.append(self.terminals[node])
+                node = self.fail.get(node, 0)
+            hits[state] = tuple(found)
+        self._hits = hits
+
     def search(self, text: str):
         """
         Searches the text using the automaton.
 
+        The text is scanned as UTF-8 bytes; match positions are reported as
+        character offsets into `text`.
+
         Args:
             text (str): The text to search through.
 
         Returns:
             list: returns a list of matched results.
         """
+        if self._delta is None:
+            self._compile()
+        delta, outputs = self._delta, self._outputs
+        output_sizes = self._output_sizes
+
+        data = text.encode("utf-8")
         state = 0
         results = []
-        for index, char in enumerate(text):
-            while (state, char) not in self.goto and state != 0:
-                state = self.fail[state]
-            if (state, char) in self.goto:
-                state = self.goto[(state, char)]
-                if state in self.output:
-                    results.append(
-                        (
-                            index - len(self.output[state]) + 1,
-                            self.output[state],
-                        )
-                    )
-            else:
-                state = 0
+        for index, symbol in enumerate(data.translate(self._symbols)):
+            state = delta[state][symbol]  # type: ignore
+            match = outputs[state]  # type: ignore
+            if match is not None:
+                start = index - output_sizes[state] + 1  # type: ignore
+                results.append((start, match))
+
+        ## byte offsets equal character offsets only for ASCII text
+        if results and len(data) != len(text):
+            results = [
+                (len(data[:start].decode("utf-8")), match)
+                for start, match in results
+            ]
         return results
+
+    def matches(self, text: str) -> set[str]:
+        """
+        Returns the patterns that occur anywhere in the text.
+
+        The text is scanned once, whatever the number of patterns; unlike
+        `search`, every pattern ending at a position is reported, including
+        those only reachable through failure links.
+
+        Args:
+            text (str): The text to search through.
+
+        Returns:
+            set[str]: The patterns found in `text`.
+        """
+        if self._delta is None:
+            self._compile()
+        delta = self._delta
+
+        state = 0
+        seen = set()
+        for symbol in text.encode("utf-8").translate(self._symbols):
+            state = delta[state][symbol]  # type: ignore
+            seen.add(state)
+
+        found = set()
+        for state in seen:
+            found.update(self._hits[state])  # type: ignore
+        return found
+
+    def dump(self, path: str):
+        """
+        Saves the automaton, with its compiled tables, to `path`.
+
+        The file is written next to `path` first and then moved into place,
+        so readers never see a partial file.
+
+        Args:
+            path (str): The file to write.
+        """
+        ## imported here to keep them off the module import path
+        import pickle
+        import tempfile
+
+        if self._delta is None:
+            self._compile()
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> AhoCorasick:
+        """
+        Loads an automaton saved with `dump`.
+
+        The file is unpickled, so only load files written by a trusted
+        process.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            AhoCorasick: The loaded automaton, ready for `search`.
+
+        Raises:
+            TypeError: If the file does not hold an `AhoCorasick`.
+        """
+        import pickle
+
+        with open(path, "rb") as file:
+            automaton = pickle.load(file)
+        if not isinstance(automaton, cls):
+            raise TypeError(f"'{path}' does not hold an {cls.__name__}")
+        return automaton
+
+    @classmethod
+    def load_or_build(cls, patterns: list[str], cache_dir: str) -> AhoCorasick:
+        """
+        Returns the automaton for `patterns`, reusing a cached build.
+
+        The cache file is named after a SHA-1 of the patterns. On a miss, or
+        if the cached file cannot be loaded, the automaton is built and saved.
+
+        Args:
+            patterns (list[str]): The patterns, in insertion order.
+            cache_dir (str): Where cached automatons are kept. Cached files
+                are unpickled, so this must not be writable by others.
+
+        Returns:
+            AhoCorasick: The built automaton, ready for `search`.
+        """
+        import hashlib
+
+        ## the package version is part of the key, as the pickled layout
+        ## may change between releases
+        key = repr((__version__, list(patterns)))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        path = os.path.join(cache_dir, f"ac_{digest}.pkl")
+        try:
+            return cls.load(path)
+        except Exception:
+            pass
+
+        automaton = cls(patterns)
+        try:
+            automaton.dump(path)
+        except OSError:
+            pass
+        return automaton
+
+
+def search_many(text: str, patterns: list[str]) -> dict[str, bool]:
+    """
+    Check which of many patterns occur in the text, in a single pass.
+
+    All `patterns` go into one `AhoCorasick` automaton, so the text is scanned once instead of once
+    per pattern. To query many texts with a fixed pattern list, build `AhoCorasick(patterns)` once
+    and call its `matches` method for each text.
+
+    Args:
+        text (str): The text to search. This may contain multiple lines.
+        patterns (list[str]): The substrings to look for; empty patterns never match.
+
+    Returns:
+        dict[str, bool]: Maps each pattern to whether it occurs in `text`.
+
+    Example:
+        >>> search_many("ushers", ["he", "she", "his"])
+        {'he': True, 'she': True, 'his': False}
+    """  # noqa: E501
+    wanted = [pattern for pattern in patterns if pattern]
+    found = AhoCorasick(wanted).matches(text) if wanted else set()
+    return {pattern: pattern in found for pattern in patterns}
@@ -0,0 +1,384 @@
+"""
+fsearch/cli.py
+
+The fsearch command-line interface.
+
+This module holds the argument parsing and subcommand handlers of the fsearch
+command-line tool; `fsearch/__main__.py` is a thin wrapper around `main`.
+It provides various subcommands to start the server, run benchmarks,
+generate samples, create SSL certificates, and stop the server.
+
+For usage and options:
+```bash
+$ python -m fsearch -h
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from types import SimpleNamespace
+
+from fsearch import __app_name__, __version__
+
+
+class _LazyLogger:
+    """Stand-in for the module logger that imports `logging` on first use.
+
+    Keeps `logging` (and its threading/weakref imports) off the CLI paths
+    that never log, such as `--version`.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._logger = None
+
+    def __getattr__(self, attr: str):
+        if self._logger is None:
+            import logging
+
+            from fsearch import setup_logging
+
+            setup_logging()
+            self._logger = logging.getLogger(self._name)
+        return getattr(self._logger, attr)
+
+
+logger = _LazyLogger(__name__)
+
+
+class DefaultArgs(SimpleNamespace):
+    """Attributes
+    ----------
+    subcommand : str
+        The subcommand to execute.
+    version : bool | None
+        The version flag.
+    config : str | None
+        The path to the configuration file.
+    """
+
+    subcommand: str
+    version: bool | None
+    config: str | None
+
+
+class StartArgs(SimpleNamespace):
+    """Namespace class to hold the arguments for the 'start' subcommand.
+
+    Attributes
+    ----------
+    config : str
+        The path to the configuration file.
+    workers : int
+        The number of server processes.
+    mode : str
+        How client connections are served, "threads" or "async".
+    """
+
+    config: str
+    workers: int
+    mode: str
+
+
+class StopArgs(SimpleNamespace):
+    """Namespace class to hold the arguments for the 'stop' subcommand.
+
+    Attributes
+    ----------
+    subcommand : str
+        The subcommand to execute.
+    """
+
+    subcommand: str
+
+
+class SamplesArgs(SimpleNamespace):
+    """Namespace class to hold the arguments for the 'samples' subcommand.
+
+    Attributes
+    ----------
+    size : int
+        The size of the sample file output in MB.
+    """
+
+    size: int
+
+
+class CertArgs(SimpleNamespace):
+    """Namespace class to hold the arguments for the 'certs' subcommand.
+
+    Attributes
+    ----------
+    dir : str
+        The output directory for the created certificates, defaults to the current directory.
+    """  # noqa: E501
+
+    dir: str
+
+
+## the serving modes of the 'start' subcommand
+_MODES = ("threads", "async")
+
+
+def _mode(value: str) -> str:
+    """Validates a 'start' serving mode, raising ValueError if unknown."""
+    if value not in _MODES:
+        raise ValueError(value)
+    return value
+
+
+def _add_start_arguments(parser):
+    """Adds the 'start' subcommand arguments to `parser`."""
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=str,
+        required=True,
+        help="Path to the configuration file",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of server processes accepting connections",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        type=str,
+        choices=_MODES,
+        default="threads",
+        help="Serve clients on a thread pool or an asyncio event loop",
+    )
+
+
+def _add_stop_arguments(parser):
+    """The 'stop' subcommand takes no arguments."""
+
+
+def _add_samples_arguments(parser):
+    """Adds the 'samples' subcommand arguments to `parser`."""
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        default=1,
+        help="Size of the sample file output in MB",
+    )
+
+
+def _add_certs_arguments(parser):
+    """Adds the 'certs' subcommand arguments to `parser`."""
+    parser.add_argument(
+        "-d",
+        "--dir",
+        type=str,
+        default=".",
+        help="Output directory for the created certificates, defaults to the current directory",  # noqa: E501
+    )
+
+
+## subcommand name -> (help, arguments registration), in help listing order
+_SUBPARSERS = {
+    "start": ("Start the server", _add_start_arguments),
+    "stop": ("Stop the server", _add_stop_arguments),
+    "samples": ("Samples data generator", _add_samples_arguments),
+    "certs": ("Utility to create SSL certificates", _add_certs_arguments),
+}
+
+
+def _cmd_start(args: StartArgs):
+    """Runs the 'start' subcommand."""
+    ## abspath leaves absolute paths untouched, so no isabs branch
+    config_path = os.path.abspath(args.config)
+    logger.debug("Starting server with configuration file: %s", config_path)
+    ## deferred so the other subcommands skip the server import graph
+    from fsearch.server import Server
+
+    server = Server(config_path, workers=args.workers, mode=args.mode)
+    server.connect()
+
+
+def _cmd_stop(args: StopArgs):
+    """Runs the 'stop' subcommand."""
+    logger.debug("Stopping the server")
+    # TODO: Add logic to stop the server
+
+
+def _cmd_samples(args: SamplesArgs):
+    """Runs the 'samples' subcommand."""
+    logger.debug("Generating test sample file")
+    from fsearch.utils import create_sample
+
+    create_sample(args.size)
+
+
+def _cmd_certs(args: CertArgs):
+    """Runs the 'certs' subcommand."""
+    logger.debug("Generating SSL certificates")
+    from fsearch.utils import generate_certs
+
+    generate_certs(args.dir)
+
+
+## subcommand name -> handler, each importing only what it needs
+_COMMANDS = {
+    "start": _cmd_start,
+    "stop": _cmd_stop,
+    "samples": _cmd_samples,
+    "certs": _cmd_certs,
+}
+
+
+## subcommand -> (namespace class, {flag: dest}, defaults, required dests)
+_OPTIONS = {
+    "start": (
+        StartArgs,
+        {
+            "-c": "config",
+            "--config": "config",
+            "-w": "workers",
+            "--workers": "workers",
+            "-m": "mode",
+            "--mode": "mode",
+        },
+        {"workers": 1, "mode": "threads"},
+        ("config",),
+    ),
+    "stop": (StopArgs, {}, {}, ()),
+    "samples": (
+        SamplesArgs,
+        {"-s": "size", "--size": "size"},
+        {"size": 1},
+        (),
+    ),
+    "certs": (CertArgs, {"-d": "dir", "--dir": "dir"}, {"dir": "."}, ()),
+}
+## dest -> converter for the non-string options
+_CONVERTERS = {"size": int, "workers": int, "mode": _mode}
+
+
+def _parse_args(argv: list[str]) -> SimpleNamespace | None:
+    """Parses `<subcommand> [flag value ...]` without building a parser.
+
+    Returns None for anything it does not fully understand (help flags,
+    unknown or missing options, bad values), so that the caller falls
+    back to argparse and its usual help and error messages.
+    """
+    if not argv or argv[0] not in _OPTIONS:
+        return None
+    subcommand, options = argv[0], argv[1:]
+    args_class, flags, defaults, required = _OPTIONS[subcommand]
+    if len(options) % 2:
+        return None
+
+    values = dict(defaults)
+    for flag, value in zip(options[::2], options[1::2]):
+        dest = flags.get(flag)
+        if dest is None:
+            return None
+        values[dest] = value
+    if any(dest not in values for dest in required):
+        return None
+
+    for dest, converter in _CONVERTERS.items():
+        if dest in values:
+            try:
+                values[dest] = converter(values[dest])
+            except ValueError:
+                return None
+    return args_class(subcommand=subcommand, **values)
+
+
+def _subcommand_end(argv: list[str]) -> int:
+    """Returns the index just past the subcommand in `argv`.
+
+    The value of a top-level `-c/--config` is skipped, so that it is not
+    taken for the subcommand. Without a subcommand, it is `len(argv)`.
+    """
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if arg in _SUBPARSERS:
+            return index + 1
+        index += 2 if arg in ("-c", "--config") else 1
+    return len(argv)
+
+
+def main():
+    """Main function to parse arguments and execute the appropriate subcommand."""  # noqa: E501
+    argv = sys.argv[1:]
+    ## answer --version before any parser is built, exiting like argparse
+    if argv in (["-v"], ["--version"]):
+        print(f"{__app_name__} ({__version__})")
+        sys.exit(0)
+
+    ## well-formed invocations never import or build argparse
+    parsed_args = _parse_args(argv)
+    if parsed_args is not None:
+        _COMMANDS[parsed_args.subcommand](parsed_args)
+        return
+
+    import argparse
+
+    ## a positional subcommand instead of add_subparsers, so only the
+    ## invoked subcommand gets a parser of its own
+    parser = argparse.ArgumentParser(
+        description="A highly performant and secure command-line server to search text files for strings.",  # noqa: E501
+        epilog="subcommands:\n"
+        + "\n".join(
+            f"  {name:<10}{summary}"
+            for name, (summary, _) in _SUBPARSERS.items()
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        add_help=False,
+    )
+    parser.add_argument(
+        "subcommand", nargs="?", choices=tuple(_SUBPARSERS), help="Subcommands"
+    )
+    parser.add_argument(
+        "-h",
+        "--help",
+        action="store_true",
+        help="show this help message and exit",
+    )
+
+    # Default (no subcommand)
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=f"{__app_name__} ({__version__})",
+    )
+    parser.add_argument(
+        "-c", "--config", type=str, help="Path to the configuration file"
+    )
+
+    ## the top-level options end at the subcommand, everything after it
+    ## belongs to the subcommand parser (e.g. its own -c/--config)
+    split = _subcommand_end(argv)
+    args, remaining = parser.parse_known_args(argv[:split])
+    remaining += argv[split:]
+
+    if args.subcommand is None:
+        parser.print_help()
+        return
+
+    summary, add_arguments = _SUBPARSERS[args.subcommand]
+    subcommand_parser = argparse.ArgumentParser(
+        prog=f"{parser.prog} {args.subcommand}", description=summary
+    )
+    add_arguments(subcommand_parser)
+    if args.help:
+        remaining.append("-h")
+    subcommand_args: DefaultArgs = subcommand_parser.parse_args(  # type: ignore
+        remaining, namespace=args
+    )
+
+    _COMMANDS[args.subcommand](subcommand_args)
+
+
+if __name__ == "__main__":
+    main()
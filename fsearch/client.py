@@ -0,0 +1,279 @@
+"""
+fsearch/client.py
+
+This module provides the client for the fsearch package.
+
+Classes:
+    - ClientArgs: Represents command-line arguments for the client.
+    - Client: Handles client operations including connecting to the server,
+      sending messages, and managing SSL connections.
+
+Functions:
+    - main: Entry point for the client, handling argument parsing and client execution.
+"""  # noqa: E501
+
+import argparse
+import logging
+import os
+import socket
+import ssl
+import sys
+from typing import Optional
+
+from fsearch import setup_logging
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+
+class ClientArgs(argparse.Namespace):
+    """Represents command-line arguments for the client.
+
+    Attributes
+    ----------
+    host : str
+        The server's hostname or IP address.
+    port : int
+        The port on which the server is listening.
+    cert : Optional[str]
+        Path to the SSL certificate file.
+    key : Optional[str]
+        Path to the SSL key file.
+    query : str
+        The string to search for on the server.
+    """
+
+    host: str
+    port: int
+    cert: Optional[str]
+    key: Optional[str]
+    query: str
+
+
+class Client:
+    """
+    A class to represent the client for the fsearch package.
+
+    Attributes
+    ----------
+    host : str
+        The server's hostname or IP address.
+    port : int
+        The port on which the server is listening.
+    certfile : Optional[str]
+        Path to the SSL certificate file.
+    keyfile : Optional[str]
+        Path to the SSL key file.
+    ssl_context : Optional[ssl.SSLContext]
+        The SSL context built from the certificate and key files.
+    client_socket : socket.socket
+        The client socket for communication with the server.
+
+    Methods
+    -------
+    __init__(host: str, port: int, certfile: Optional[str] = None, keyfile: Optional[str] = None):
+        Initializes the client with configurations and connects to the server.
+    load_ssl():
+        Secures the client socket with SSL using the provided certificate and key files.
+    connect():
+        Connects the client to the server.
+    send_message(message: str) -> str:
+        Sends a message to the server and returns the response.
+    send_bytes(payload: bytes) -> bytes:
+        Sends an encoded payload to the server and returns the raw response.
+    close():
+        Closes the connection to the server.
+    """  # noqa: E501
+
+    host: str
+    port: int
+    certfile: Optional[str]
+    keyfile: Optional[str]
+    ssl_context: Optional[ssl.SSLContext]
+    client_socket: socket.socket
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        certfile: Optional[str] = None,
+        keyfile: Optional[str] = None,
+        log_level: Optional[str] = "DEBUG",
+    ):
+        """
+        Initializes the client with configurations and connects to the server.
+
+        Parameters
+        ----------
+        host : str
+            The server's hostname or IP address.
+        port : int
+            The port on which the server is listening.
+        certfile : Optional[str], optional
+            Path to the SSL certificate file, by default None.
+        keyfile : Optional[str], optional
+            Path to the SSL key file, by default None.
+        log_level : Optional[str], optional
+            Log level verbosity, by default DEBUG.
+
+        Raises
+        ------
+        Exception
+            If the SSL certificate or key file paths do not exist.
+        """
+
+        self.host = host
+        self.port = port
+
+        # Configure the log level
+        level = logging.getLevelName(log_level)  # type: ignore
+        logger.setLevel(level)
+
+        if certfile and not os.path.exists(certfile):
+            raise Exception("ssl cert path does not exist")
+        if keyfile and not os.path.exists(keyfile):
+            raise Exception("key path does not exist")
+        self.certfile = certfile
+        self.keyfile = keyfile
+
+        # Build the SSL context once, the cert chain is loaded a single time
+        self.ssl_context = None
+        if self.certfile:
+            self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            ## the server certificates are self-signed, skip verification
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+            self.ssl_context.load_cert_chain(self.certfile, self.keyfile)
+
+        # Open a single keep-alive connection reused by every message
+        self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        ## Disable Nagle's algorithm, queries are small request/response pairs
+        self.client_socket.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+        if self.ssl_context:
+            self.load_ssl()
+        self.connect()
+
+    def load_ssl(self):
+        """
+        Secures the client socket with SSL using the provided certificate and key files.
+
+        This method wraps the client socket with the client's `SSLContext` to enable secure
+        communication with the server. If the SSL handshake fails, the process exits with an error.
+        """  # noqa: E501
+        try:
+            self.client_socket = self.ssl_context.wrap_socket(  # type: ignore
+                self.client_socket, server_hostname=self.host
+            )
+        except ssl.SSLError as e:
+            logger.error(f"SSL handshake Error: {e}")
+            sys.exit()
+
+    def connect(self):
+        """
+        Connects the client to the server.
+
+        This method attempts to establish a connection to the server using the
+        specified host and port. If the connection fails, the process exits with an error.
+        """  # noqa: E501
+        try:
+            host, port = self.host, self.port
+            self.client_socket.connect((host, port))
+            logger.debug(f"Connected to server at {host}:{port}")
+        except Exception as e:
+            logger.error(f"Error connecting to server: {e}")
+            sys.exit()
+
+    def send_message(self, message: str) -> str:
+        """
+        Sends a message to the server and returns the response.
+
+        The message is sent over the persistent connection opened when
+        the client was created.
+
+        Parameters:
+            message : str
+                The message to send to the server.
+
+        Returns:
+            str
+                The response from the server.
+        """
+        response = self.send_bytes(message.encode("utf-8"))
+        return response.decode("utf-8")
+
+    def send_bytes(self, payload: bytes) -> bytes:
+        """
+        Sends an already encoded payload to the server and returns the raw response.
+
+        Parameters:
+            payload : bytes
+                The UTF-8 encoded message to send to the server.
+
+        Returns:
+            bytes
+                The raw response from the server.
+        """  # noqa: E501
+        try:
+            ## messages are not framed, each reply is read before the next
+            ## message is sent, or the server takes them as one query
+            self.client_socket.sendall(payload)
+            return self.client_socket.recv(1024)
+        except Exception as e:
+            logger.warning(f"Error sending message: {e}")
+            return b""
+
+    def close(self):
+        """
+        Closes the connection to the server.
+        """
+        try:
+            self.client_socket.close()
+        except OSError:
+            pass
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    """
+    Entry point for the fsearch client.
+
+    This function parses command-line arguments and creates a Client instance
+    to send a search query to the server. The server's response is then printed
+    to the console.
+    """
+    parser = argparse.ArgumentParser(description="fsearch client")
+
+    parser.add_argument(
+        "--host", type=str, default="0.0.0.0", help="The server port"
+    )
+    parser.add_argument(
+        "-p", "--port", type=int, required=True, help="The server port"
+    )
+    parser.add_argument(
+        "-c", "--cert", type=str, help="Optional SSL server cert file path"
+    )
+    parser.add_argument(
+        "-k", "--key", type=str, help="Optional cert key file path"
+    )
+    parser.add_argument(
+        "query", type=str, nargs="?", help="String to search for"
+    )
+
+    args: ClientArgs = parser.parse_args()  # type: ignore
+
+    with Client(
+        args.host, args.port, certfile=args.cert, keyfile=args.key
+    ) as client:
+        response = client.send_message(args.query)
+    print(f"Response from server: {response}")
+
+
+if __name__ == "__main__":
+    main()
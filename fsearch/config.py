@@ -23,7 +23,25 @@ Example usage:
 """
 
 from dataclasses import dataclass, field, fields
-from typing import Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
+
+
+def _to_bool(value) -> bool:
+    """Converts a config value such as 'yes', 'true', 'on' or '1' to a bool."""
+    if isinstance(value, bool):
+        return value
+    return value.lower() in ("yes", "true", "on", "1")
+
+
+def _to_int(value) -> int:
+    """Converts a config value to an int."""
+    if isinstance(value, int):
+        return value
+    return int(value)
+
+
+# the converters applied to string values, by field type
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {bool: _to_bool, int: _to_int}
 
 
 @dataclass
@@ -52,6 +70,9 @@ class Config:
     reread_on_query: bool = False
     extra: dict = field(default_factory=dict)
 
+    # (name, converter, default) per field, built once below the class
+    _SCHEMA: ClassVar[Tuple[Tuple[str, Optional[Callable], Any], ...]] = ()
+
     def __init__(self, **kwargs):
         """
         Initializes the Config object with the provided keyword arguments.
@@ -59,19 +80,20 @@ class Config:
         Args:
             **kwargs: Arbitrary keyword arguments used to initialize the configuration fields.
         """  # noqa: E501
-        for f in fields(self):
-            key = f.name.lower()
-            if key in kwargs:
-                val: str = kwargs.pop(key)
-                if f.type.__name__ == "bool" and not isinstance(val, bool):  # type: ignore
-                    val = val.lower() in ("yes", "true", "on" "1")  # type: ignore
-
-                if f.type.__name__ == "int" and not isinstance(val, int):  # type: ignore
-                    val = int(val)  # type: ignore
-
-                setattr(self, key, val)
+        for name, convert, default in self._SCHEMA:
+            if name in kwargs:
+                val = kwargs.pop(name)
+                setattr(self, name, convert(val) if convert else val)
             else:
-                setattr(self, key, f.default)
+                setattr(self, name, default)
 
         # Store any additional kwargs in the extra dictionary
         self.extra = kwargs
+
+
+## resolve the field types once, instead of inspecting them per instance
+Config._SCHEMA = tuple(
+    (f.name, _CONVERTERS.get(f.type), f.default)  # type: ignore
+    for f in fields(Config)
+    if f.name != "extra"
+)
@@ -17,18 +17,26 @@ Example usage:
 
 import logging
 import os
+import selectors
+import signal
 import socket
 import ssl
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
-from fsearch.algorithms import regex_search
+from fsearch import setup_logging
+from fsearch.algorithms import native_search
 from fsearch.config import Config
-from fsearch.utils import generate_certs, read_config, read_file
+from fsearch.utils import generate_certs, read_config, read_file_bytes
 
+if TYPE_CHECKING:
+    import asyncio
+
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -46,6 +54,8 @@ class Server:
         The server configuration object.
     server_socket : socket.socket
         The server's main socket for handling connections.
+    ssl_context : Optional[ssl.SSLContext]
+        The TLS context client connections are wrapped with, when ssl is enabled.
     is_running : bool
         A flag indicating whether the server is currently running.
     max_payload : int
@@ -54,8 +64,15 @@ class Server:
         The maximum number of concurrent connections. Defaults to 5.
     max_rows : int
         The maximum number of lines to read from the linux-path file. Defaults to 250,000.
-    database : str
-        The content of the linux-path file used as the server's database.
+    workers : int
+        The number of processes accepting connections. Defaults to 1.
+    mode : str
+        How client connections are served, "threads" or "async". Defaults to "threads".
+    database : bytes
+        The undecoded content of the linux-path file used as the server's database.
+    lineset : Optional[frozenset]
+        The lines of the database, for constant time lookups. Only built when the
+        database is not re-read on every query.
 
     Methods
     -------
@@ -63,7 +80,7 @@ class Server:
         Initializes the server with configuration settings and creates a socket.
 
     load_ssl()
-        Secures the server socket with TLS. Generates self-signed SSL certificates if the
+        Builds the TLS context for client connections. Generates self-signed SSL certificates if the
         certfile or keyfile specified in the configuration does not exist.
 
     load_database()
@@ -72,31 +89,101 @@ class Server:
     connect()
         Starts the server, binds the socket, and begins listening for incoming connections.
 
+    _fork_workers()
+        Forks the extra worker processes that share the listening socket.
+
+    _watch()
+        Starts a thread flagging changes to the configuration and linux-path files, if
+        inotify_simple is installed.
+
+    _add_watches()
+        Watches the directories of the configuration and linux-path files.
+
+    _watch_files()
+        Reads the inotify events and flags the changes until the server stops.
+
     receive()
-        Handles incoming client connections and spawns a new thread for each client.
+        Handles incoming client connections and hands each one to the worker thread pool.
+
+    _dispatch()
+        Hands the idle client connections that became readable back to the worker thread pool.
+
+    _serve()
+        Serves client connections from an asyncio event loop.
+
+    _stop_async()
+        Closes the asyncio server and its client connections, on the event loop.
+
+    _handle_async(reader: asyncio.StreamReader, writer: asyncio.StreamWriter)
+        Handles communication with a client connected to the event loop.
+
+    _database_stamp() -> Optional[tuple]
+        Returns the path, modification time and size of the linux-path file.
+
+    _refresh()
+        Re-reads the configurations if the file changed and re-loads the database if `reread_on_query` is set.
+
+    _recv_buffer() -> bytearray
+        Returns the calling thread's reusable receive buffer.
 
     _handle_client(client_socket: socket.socket, start_time: float, client_address: str)
-        Handles communication with a connected client.
+        Secures a newly connected client, if ssl is enabled, and parks it until its first query.
+
+    _park(client_socket: socket.socket, client_address: str)
+        Parks an idle client connection in the selector until its next query arrives.
+
+    _close_client(client_socket: socket.socket)
+        Closes a client connection and forgets it.
+
+    _serve_client(client_socket: socket.socket, start_time: float, client_address: str)
+        Serves the queries received from a client, then parks the idle connection.
 
     stop()
-        Stops the server and closes the socket.
+        Stops the server, closes the client connections and the socket.
 
-    search(query: str) -> str
+    search(query: Union[str, bytes]) -> str
         Searches for a query in the server's database using the configured search algorithm.
+
+    _respond(query: bytes) -> bytes
+        Returns the encoded response for a query received from a client.
     """  # noqa: E501
 
     config_path: str
     configs: Config
     server_socket: socket.socket
+    ssl_context: Optional[ssl.SSLContext] = None
     is_running: bool = False
     # the max request payload size. Defaults to 1024
     max_payload: int = 1024
     # the maximum number of concurrent connections.
     max_conn: int = 5
+    # the number of pooled threads serving the client queries
+    max_workers: int = 32
     # the maximum number of lines to be read from linux-path file
     max_rows: int = 250000
-    # the contents of linux-path used as the server database
-    database: str = ""
+    # the number of processes accepting connections
+    workers: int = 1
+    # "threads" serves clients on pooled threads, "async" on an event loop
+    mode: str = "threads"
+    # the undecoded contents of linux-path used as the server database
+    database: bytes = b""
+    # the database lines, when the database outlives a single query
+    lineset: Optional[frozenset] = None
+    # the seconds a client may take to complete the TLS handshake
+    handshake_timeout: float = 5.0
+    # the (path, mtime, size) of linux-path when the database was loaded
+    _database_mtime: Optional[tuple] = None
+    # the running event loop, in the async mode
+    _loop: Optional["asyncio.AbstractEventLoop"] = None
+    # the asyncio server on that loop, once it is started
+    _async_server: Optional["asyncio.Server"] = None
+    # set by _stop_async, the serving loop is then cancelled on purpose
+    _stopping: bool = False
+    # set by the inotify watcher when the config or database file changed
+    _dirty: Optional[threading.Event] = None
+    # the encoded responses, sent as is for every query
+    FOUND: bytes = b"STRING EXISTS"
+    NOT_FOUND: bytes = b"STRING NOT FOUND"
 
     def __init__(
         self,
@@ -104,6 +191,8 @@ class Server:
         port: Optional[int] = None,
         max_conn: int = 5,
         log_level: Optional[str] = None,
+        workers: int = 1,
+        mode: str = "threads",
     ):
         """
         Initializes the Server with configuration settings and creates a socket.
@@ -118,9 +207,15 @@ class Server:
             The maximum number of concurrent connections, by default 5.
         log_level : str, optional
             Overide log level in config file, by default None.
+        workers : int, optional
+            The number of processes accepting connections on the listening socket, by default 1.
+        mode : str, optional
+            "threads" to serve clients on a thread pool, or "async" to serve them from a single
+            asyncio event loop, by default "threads".
         """  # noqa: E501
 
         self.config_path = config_path
+        self._config_mtime = self._config_stamp()
         self.configs = read_config(config_path)
 
         # Override port in config file if provided
@@ -147,18 +242,39 @@ class Server:
         if self.configs.ssl:  ## load ssl if only ssl is set to true
             self.load_ssl()
 
-        logger.debug(f"Using configurations {asdict(self.configs)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Using configurations %s", asdict(self.configs))
 
         self.load_database()
         self.is_running = False
         self.max_conn = max_conn
+        self.workers = max(1, workers)
+        if mode not in ("threads", "async"):
+            raise ValueError(f"Unknown server mode: {mode}")
+        self.mode = mode
+        ## pids of the forked worker processes, in the parent only
+        self._children = []
+        ## per worker thread state, i.e. the receive buffer
+        self._local = threading.local()
+        ## idle keep-alive clients, waiting for their next query
+        self._selector: Optional[selectors.BaseSelector] = None
+        ## the open client sockets, shut down by stop
+        self._clients = set()
+        ## the client streams of the async mode, closed by stop
+        self._writers = set()
+        ## workers only run clients with a query ready, idle ones are parked
+        ## in the selector, so the pool is sized for concurrent queries
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fsearch-client"
+        )
 
     def load_ssl(self):
         """
-        Secures the server socket with TLS.
+        Builds the TLS context used to secure client connections.
 
         If the configuration's certfile or keyfile does not exist, this method will generate
-        self-signed SSL certificates.
+        self-signed SSL certificates. The listening socket stays plain and each accepted client
+        socket is wrapped, with its handshake run on the worker thread serving it.
         """  # noqa: E501
         # if not self.configs.certfile and not self.configs.keyfile:
         #    raise ValueError("certfile not provided in configs")
@@ -167,22 +283,49 @@ class Server:
         ):
             self.configs.certfile, self.configs.keyfile = generate_certs()
 
+        ## the certificate chain is parsed once; each accepted connection is
+        ## wrapped with this context, which also keeps the session cache
         try:
-            self.server_socket = ssl.wrap_socket(  # type: ignore (pylance warning)
-                self.server_socket,
-                server_side=True,
-                certfile=self.configs.certfile,
-                keyfile=self.configs.keyfile,
-                ssl_version=ssl.PROTOCOL_TLS,
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(
+                self.configs.certfile,  # type: ignore
+                self.configs.keyfile,
             )
+            ## TLS 1.2+ with forward secret AEAD ciphers only, the TLS 1.3
+            ## suites are not affected by set_ciphers
+            context.minimum_version = ssl.TLSVersion.TLSv1_2
+            context.set_ciphers("ECDHE+AESGCM:ECDHE+CHACHA20")
+            context.options |= ssl.OP_NO_COMPRESSION
+            self.ssl_context = context
         except Exception as e:
-            print("load_ssl.error", e)
+            logger.error(f"load_ssl.error {e}")
 
     def load_database(self):
         """
         Loads the content of the linux-path file specified in the configuration as the server's database.
+
+        The file is memory-mapped and kept as bytes, so queries are matched without decoding either
+        side. Unless `reread_on_query` is set, the database lines are also collected in `lineset` so that
+        queries are answered with a hash lookup instead of a scan. A database re-read for every query
+        would only be looked up once, which a single scan does faster than building the set.
+
+        The file is only read again when its path, modification time or size changed since the last
+        load.
         """  # noqa: E501
-        self.database = read_file(self.configs.linuxpath)
+        stamp = self._database_stamp()
+        if stamp is not None and stamp == self._database_mtime:
+            if self.configs.reread_on_query:
+                self.lineset = None
+            elif self.lineset is None:
+                self.lineset = frozenset(self.database.split(b"\n"))
+            return
+
+        self.database = read_file_bytes(self.configs.linuxpath)
+        self._database_mtime = stamp
+        if self.configs.reread_on_query:
+            self.lineset = None
+        else:
+            self.lineset = frozenset(self.database.split(b"\n"))
 
     def connect(self):
         """
@@ -194,8 +337,17 @@ class Server:
             # self.server_socket.setblocking(False)
             self.server_socket.listen(self.max_conn)
             self.is_running = True
-            logger.debug(f"Server started on {host}:{port}")
-            self.receive()
+            logger.debug("Server started on %s:%s", host, port)
+            if self.workers > 1:
+                self._fork_workers()
+            self._watch()
+            if self.mode == "async":
+                ## deferred, the threaded server never needs the event loop
+                import asyncio
+
+                asyncio.run(self._serve())
+            else:
+                self.receive()
         except KeyboardInterrupt:
             logger.debug("Exiting the server...")
             self.stop()
@@ -204,81 +356,510 @@ class Server:
             logger.debug("Exiting the server...")
             sys.exit(0)
 
+    def _fork_workers(self):
+        """
+        Forks `workers - 1` processes that accept on the listening socket as well.
+
+        The socket and the loaded database are inherited, with the database pages shared
+        copy-on-write, and each process serves its clients on its own threads and GIL. The
+        parent keeps the pids so that `stop` can terminate the workers.
+        """  # noqa: E501
+        if not hasattr(os, "fork"):
+            logger.warning(
+                "os.fork is not available, serving from one process"
+            )
+            return
+
+        for _ in range(self.workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                ## no pool thread runs before the first accept, so the
+                ## inherited pool is usable as is
+                self._children = []
+                return
+            self._children.append(pid)
+        logger.debug("Forked worker processes %s", self._children)
+
+    def _watch(self):
+        """
+        Starts a daemon thread that flags changes to the configuration and linux-path files.
+
+        With the optional `inotify_simple` package on Linux, `_refresh` then skips the
+        stat calls of its checks until a watched file changes. Without it, the files are
+        checked by stat before every query. Each forked worker starts its own watcher, as
+        threads do not survive the fork.
+        """  # noqa: E501
+        try:
+            from inotify_simple import INotify, flags
+        except ImportError:
+            return
+
+        ## the directories are watched, so files replaced by a rename (as
+        ## editors save them) keep being followed
+        self._inotify = INotify()
+        self._watch_mask = (
+            flags.MODIFY
+            | flags.CLOSE_WRITE
+            | flags.ATTRIB
+            | flags.MOVED_TO
+            | flags.CREATE
+            | flags.DELETE
+        )
+        self._watched = {}
+        self._dirty = threading.Event()
+        self._add_watches()
+        threading.Thread(
+            target=self._watch_files, name="fsearch-watcher", daemon=True
+        ).start()
+
+    def _add_watches(self):
+        """
+        Watches the directories of the configuration and linux-path files,
+        unless already watched.
+        """
+        for path in (self.config_path, self.configs.linuxpath):
+            if not path:
+                continue
+            directory = os.path.dirname(os.path.abspath(path))
+            if directory not in self._watched.values():
+                wd = self._inotify.add_watch(directory, self._watch_mask)
+                self._watched[wd] = directory
+
+    def _watch_files(self):
+        """
+        Reads the inotify events and sets `_dirty` when a watched file changed,
+        until the server stops.
+        """
+        try:
+            while self.is_running:
+                paths = {
+                    os.path.abspath(path)
+                    for path in (self.config_path, self.configs.linuxpath)
+                    if path
+                }
+                for event in self._inotify.read(timeout=1000):
+                    directory = self._watched.get(event.wd)
+                    if (
+                        directory is not None
+                        and os.path.join(directory, event.name) in paths
+                    ):
+                        self._dirty.set()
+        except Exception as e:
+            logger.error("Error watching files: %s", e)
+            ## fall back to checking the files before every query
+            self._dirty = None
+        finally:
+            self._inotify.close()
+
     def receive(self):
         """
-        Handles incoming connections and starts a new thread for each client.
+        Handles incoming connections and serves each client on a pooled worker thread.
 
         This method should be called after the socket is bound and listening for connections.
+        Idle keep-alive connections are parked in a selector instead of holding a pool thread,
+        so any number of connected clients is served by the bounded pool.
         """  # noqa: E501
         ## notes:  https://docs.python.org/3/howto/sockets.html
 
+        ## created here, after any fork, so workers don't share one selector
+        self._selector = selectors.DefaultSelector()
+        threading.Thread(
+            target=self._dispatch, name="fsearch-dispatch", daemon=True
+        ).start()
+
         while self.is_running:
             try:
                 client_socket, client_address = self.server_socket.accept()
-
-                # Re-read configs to check if reread_on_query has changed
-                self.configs = read_config(self.config_path)
-                logger.debug(
-                    f"[REREAD_ON_QUERY] = {self.configs.reread_on_query}"
+                ## queries are only timed for the debug log
+                start_time: Optional[float] = (
+                    time.perf_counter()
+                    if logger.isEnabledFor(logging.DEBUG)
+                    else None
                 )
-
-                start_time: float = time.perf_counter()
-
-                # Re-load the database if reread_on_query is enabled
-                if self.configs.reread_on_query:
-                    self.load_database()
-
-                client_handler = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, start_time, client_address),
+                ## send each small response at once instead of letting
+                ## Nagle hold it back for the ack of the previous one
+                client_socket.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+                )
+                self._clients.add(client_socket)
+
+                ## reuse pooled threads instead of starting one per client
+                self._pool.submit(
+                    self._handle_client,
+                    client_socket,
+                    start_time,
+                    client_address,
                 )
-                client_handler.start()
-            except ssl.SSLError as e:
-                logger.error(f"Client SSL ERROR: {e}")
             except Exception:
                 logger.debug("SERVER CONNECTIONS CLOSED")
 
+    def _dispatch(self):
+        """
+        Hands the parked client connections that became readable back to the pool, until
+        `stop` closes the selector.
+        """  # noqa: E501
+        selector = self._selector
+        try:
+            while True:
+                for key, _ in selector.select(timeout=0.5):
+                    selector.unregister(key.fileobj)
+                    self._pool.submit(
+                        self._serve_client, key.fileobj, None, key.data
+                    )
+        except (OSError, ValueError, RuntimeError):
+            ## the selector, or the pool, was closed by stop
+            pass
+
+    async def _serve(self):
+        """
+        Serves client connections from an asyncio event loop on the listening socket.
+
+        Idle keep-alive clients cost a coroutine instead of a pooled thread, and the TLS
+        handshake, if ssl is enabled, is done by the event loop with the same context. The
+        loop runs until `stop` closes the server from any thread, through `_stop_async`.
+        """  # noqa: E501
+        import asyncio
+
+        ## published before the server starts, so that a stop from now on
+        ## is always handed to the loop that owns the listening socket
+        self._loop = asyncio.get_running_loop()
+        self._async_server = None
+        self._stopping = False
+        try:
+            self.server_socket.setblocking(False)
+            server = await asyncio.start_server(
+                self._handle_async,
+                sock=self.server_socket,
+                ssl=self.ssl_context,
+                limit=self.max_payload,
+            )
+            self._async_server = server
+            async with server:
+                if not self._stopping:
+                    await server.serve_forever()
+        except asyncio.CancelledError:
+            ## serve_forever is cancelled by closing the server, any other
+            ## cancel (the KeyboardInterrupt of asyncio.run) goes on to connect
+            if not self._stopping:
+                raise
+        finally:
+            self._loop = None
+
+    def _stop_async(self):
+        """
+        Closes the asyncio server and its client connections, on the event loop.
+        """  # noqa: E501
+        self._stopping = True
+        ## not set yet while the server is starting, _serve then closes it
+        if self._async_server is not None:
+            self._async_server.close()
+        for writer in list(self._writers):
+            writer.close()
+
+    async def _handle_async(
+        self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter"
+    ):
+        """
+        Handles communication with a client connected to the event loop.
+
+        Like `_handle_client`, every payload received is served as a query until the
+        client closes its end of the connection.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The stream the client queries are read from.
+        writer : asyncio.StreamWriter
+            The stream the responses are written to.
+        """  # noqa: E501
+        client_address = writer.get_extra_info("peername")
+        ## queries are only timed for the debug log
+        timed = logger.isEnabledFor(logging.DEBUG)
+        start_time: Optional[float] = time.perf_counter() if timed else None
+        self._writers.add(writer)
+        try:
+            while True:
+                data = await reader.read(self.max_payload)
+                if not data:
+                    break
+
+                # time follow-up queries from when they are received
+                if timed and start_time is None:
+                    start_time = time.perf_counter()
+
+                self._refresh()
+                # Strip null characters, the query is matched as bytes
+                request_data = data.rstrip(b"\x00")
+                response = self._respond(request_data)
+                if timed:
+                    duration: float = time.perf_counter() - start_time
+                writer.write(response)
+                await writer.drain()
+                ## only decode the query when the line is actually logged
+                if timed:
+                    logger.debug(
+                        "Query: %s, IP: %s, Execution Time: %s ms",
+                        request_data.decode("utf-8", "replace"),
+                        client_address,
+                        round(duration * 1000, 2),
+                    )
+                start_time = None
+        except Exception as e:
+            logger.error("Error handling client: %s", e)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _config_stamp(self) -> Optional[tuple]:
+        """
+        Returns the modification time and size of the configuration file,
+        or None if it cannot be read.
+        """
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _database_stamp(self) -> Optional[tuple]:
+        """
+        Returns the path, modification time and size of the linux-path
+        file, or None if it cannot be read.
+        """
+        path = self.configs.linuxpath
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self):
+        """
+        Re-reads the configurations if the file changed and, if
+        `reread_on_query` is enabled, re-loads the database before a query
+        is served.
+        """
+        ## with a watcher, the files are only checked once flagged changed
+        dirty = self._dirty
+        if dirty is not None:
+            if not dirty.is_set():
+                return
+            ## cleared first, so changes made while re-reading are not lost
+            dirty.clear()
+
+        # Re-read configs only when the file was modified since last read
+        stamp = self._config_stamp()
+        if stamp is None or stamp != self._config_mtime:
+            self._config_mtime = stamp
+            self.configs = read_config(self.config_path)
+            logger.debug(
+                "[REREAD_ON_QUERY] = %s", self.configs.reread_on_query
+            )
+            ## linuxpath may have moved to another directory
+            if dirty is not None:
+                self._add_watches()
+
+        # Re-load the database if reread_on_query is enabled
+        if self.configs.reread_on_query:
+            self.load_database()
+
+    def _recv_buffer(self) -> bytearray:
+        """
+        Returns the receive buffer owned by the calling thread, allocating it
+        on the thread's first connection.
+        """
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None or len(buffer) != self.max_payload:
+            buffer = self._local.buffer = bytearray(self.max_payload)
+        return buffer
+
     def _handle_client(
         self,
         client_socket: socket.socket,
-        start_time: float,
+        start_time: Optional[float],
         client_address: str,
     ):
         """
-        Handles communication with a connected client.
+        Handles a newly connected client.
+
+        The client socket is wrapped with the TLS context if ssl is enabled, and then parked
+        until its first query arrives. Without a selector, its queries are served right away.
 
         Parameters
         ----------
         client_socket : socket.socket
             The socket object representing the client connection.
-        start_time : float
-            The time when the connection was established.
+        start_time : Optional[float]
+            The time when the connection was established, or None if queries are not timed.
         client_address : str
             The address of the connected client.
+        """  # noqa: E501
+        if self.ssl_context is not None:
+            try:
+                ## a client stalling the handshake must not keep the thread
+                client_socket.settimeout(self.handshake_timeout)
+                tls_socket = self.ssl_context.wrap_socket(
+                    client_socket,
+                    server_side=True,
+                    do_handshake_on_connect=False,
+                )
+            except (ssl.SSLError, OSError) as e:
+                self._close_client(client_socket)
+                logger.error("Client SSL ERROR: %s", e)
+                return
+            ## the plain socket is detached into the TLS one, tracked before
+            ## the handshake so that stop can interrupt it
+            self._clients.discard(client_socket)
+            self._clients.add(tls_socket)
+            client_socket = tls_socket
+            try:
+                client_socket.do_handshake()
+                client_socket.settimeout(None)
+            except (ssl.SSLError, OSError) as e:
+                self._close_client(client_socket)
+                logger.error("Client SSL ERROR: %s", e)
+                return
+            # time the first query from after the handshake
+            if start_time is not None:
+                start_time = time.perf_counter()
+
+        ## wait for the first query in the selector, not on this thread
+        pending = getattr(client_socket, "pending", None)
+        if self._selector is not None and not (pending and pending()):
+            self._park(client_socket, client_address)
+            return
+        self._serve_client(client_socket, start_time, client_address)
+
+    def _park(self, client_socket: socket.socket, client_address: str):
+        """
+        Parks an idle client connection in the selector until its next query
+        arrives, closing it if it cannot be parked.
         """
-
         try:
-            # Receive request payload, strip null characters, and decode to UTF-8  # noqa: E501
-            request_data = (
-                client_socket.recv(self.max_payload)
-                .rstrip(b"\x00")
-                .decode("utf-8")
-            )
-            response = self.search(request_data)
-            duration: float = time.perf_counter() - start_time
-            client_socket.sendall(response.encode("utf-8"))
-            duration_ms = round(duration * 1000, 2)
-            logger.debug(
-                f"Query: {request_data}, IP: {client_address}, Execution Time: {duration_ms} ms"  # noqa: E501
+            self._selector.register(
+                client_socket, selectors.EVENT_READ, client_address
             )
+        except (OSError, ValueError, KeyError) as e:
+            self._close_client(client_socket)
+            logger.debug("Client connection dropped: %s", e)
+
+    def _close_client(self, client_socket: socket.socket):
+        """
+        Closes a client connection and forgets it.
+        """
+        self._clients.discard(client_socket)
+        client_socket.close()
+
+    def _serve_client(
+        self,
+        client_socket: socket.socket,
+        start_time: Optional[float],
+        client_address: str,
+    ):
+        """
+        Serves the queries received from a connected client.
+
+        The connection is kept alive: once no more data is pending, it is parked in the
+        selector until its next query arrives, or served until the client closes its end of
+        the socket when no selector runs. A closed or failed connection is closed.
+
+        Parameters
+        ----------
+        client_socket : socket.socket
+            The socket object representing the client connection.
+        start_time : Optional[float]
+            The time when the query was received, or None to take it on receipt.
+        client_address : str
+            The address of the connected client.
+        """  # noqa: E501
+
+        ## receive into the worker's buffer instead of a new bytes per packet
+        buffer = self._recv_buffer()
+        view = memoryview(buffer)
+        ## queries are only timed for the debug log
+        timed = logger.isEnabledFor(logging.DEBUG)
+        parked = False
+        try:
+            while True:
+                size = client_socket.recv_into(buffer)
+                if not size:
+                    break
+
+                # time follow-up queries from when they are received
+                if timed and start_time is None:
+                    start_time = time.perf_counter()
+
+                self._refresh()
+                # Strip null characters, the query is matched as bytes
+                while size and buffer[size - 1] == 0:
+                    size -= 1
+                request_data = view[:size].tobytes()
+                response = self._respond(request_data)
+                if timed:
+                    duration: float = time.perf_counter() - start_time
+                client_socket.sendall(response)
+                ## only decode the query when the line is actually logged
+                if timed:
+                    logger.debug(
+                        "Query: %s, IP: %s, Execution Time: %s ms",
+                        request_data.decode("utf-8", "replace"),
+                        client_address,
+                        round(duration * 1000, 2),
+                    )
+                start_time = None
+
+                ## TLS may hold decrypted data the selector cannot see
+                pending = getattr(client_socket, "pending", None)
+                if self._selector is None or (pending and pending()):
+                    continue
+                self._park(client_socket, client_address)
+                parked = True
+                break
         except Exception as e:
-            logger.error(f"Error handling client: {e}")
+            logger.error("Error handling client: %s", e)
+        finally:
+            view.release()
+            if not parked:
+                self._close_client(client_socket)
 
     def stop(self):
         """
-        Stops the server and closes the socket.
+        Stops the server and its forked workers, and closes the client
+        connections and the socket.
         """
         self.is_running = False
+        ## terminate forked workers before the shared socket is shut down
+        for pid in self._children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._children = []
+        ## the event loop owns the listening socket, it closes it with the
+        ## asyncio server
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop_async)
+                logger.debug("---Server stopped---")
+                return
+            except RuntimeError:
+                ## the loop closed in the meantime
+                pass
+        ## let running handlers finish on their own, without waiting here,
+        ## and drop the connections still queued for a worker
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._selector is not None:
+            self._selector.close()
+        ## wake the handlers still reading from clients, and close the idle
+        ## connections, or their threads keep the process from exiting
+        for client_socket in list(self._clients):
+            try:
+                client_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._close_client(client_socket)
         try:
             # self.server_socket.close()
             self.server_socket.shutdown(socket.SHUT_RDWR)
@@ -289,14 +870,14 @@ class Server:
             logger.error(f"Error stopping server: {e}")
         self.server_socket.close()
 
-    def search(self, query: str) -> str:
+    def search(self, query: Union[str, bytes]) -> str:
         """
         Searches for the specified query in the server's database using the configured search algorithm.
 
         Parameters
         ----------
-        query : str
-            The search query.
+        query : Union[str, bytes]
+            The search query, as text or as UTF-8 encoded bytes.
 
         Returns
         -------
@@ -304,8 +885,18 @@ class Server:
             The search result, either "STRING EXISTS" or "STRING NOT FOUND".
         """  # noqa: E501
 
-        found = regex_search(self.database, query)
-        if found:
-            return "STRING EXISTS"
+        if isinstance(query, str):
+            query = query.encode("utf-8")
+        return self._respond(query).decode("utf-8")
+
+    def _respond(self, query: bytes) -> bytes:
+        """
+        Returns the encoded response sent to a client for the query bytes.
+        """
+        ## a stand-alone line never contains a newline, so membership in
+        ## the split lines is exactly a full-line match
+        if self.lineset is not None:
+            found = query in self.lineset
         else:
-            return "STRING NOT FOUND"
+            found = native_search(self.database, query)
+        return self.FOUND if found else self.NOT_FOUND
@@ -7,6 +7,7 @@ random data generation, benchmarking, and certificate generation.
 Functions:
     - read_config: Reads server configurations from a file into a `Config` object.
     - read_file: Reads a specified number of lines from a file.
+    - read_file_bytes: Reads the same lines as `read_file` as undecoded bytes.
     - compute_lps: Computes the Longest Prefix Suffix (LPS) array for the KMP search algorithm.
     - generate_certs: Generates or retrieves self-signed SSL certificates.
     - generate_random_string: Generates a random string of specified length.
@@ -20,16 +21,20 @@ Functions:
 import base64
 import configparser
 import logging
+import mmap
 import os
 import random
 import string
 import subprocess
 import timeit
+from functools import partial
 from io import BytesIO
 from typing import Dict, List, Optional, Tuple
 
+from fsearch import setup_logging
 from fsearch.config import Config
 
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +102,56 @@ def read_file(filepath: str, max_lines: int = 250000) -> str:
     return "".join(lines)
 
 
+def read_file_bytes(filepath: str, max_lines: int = 250000) -> bytes:
+    """
+    Reads the same leading lines of a file as `read_file`, without decoding them.
+
+    The file is memory-mapped and only the leading region is copied out, so no text decoding or
+    per-line objects are involved. Line endings are translated to `\\n` as in text mode and, like
+    `file.readlines(max_lines)`, whole lines are kept until the size hint is passed; a non-positive
+    `max_lines` reads the whole file. The hint counts bytes, which is the same as `read_file` for
+    ASCII files.
+
+    Args:
+        filepath (str): The path to the file to read.
+        max_lines (int): The size hint, as passed to `file.readlines`. Defaults to 250,000.
+
+    Returns:
+        bytes: The selected file contents.
+
+    Raises:
+        FileNotFoundError: If the provided filepath does not exist.
+    """  # noqa: E501
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(f"The file '{filepath}' does not exist.")
+
+    try:
+        with open(filepath, "rb") as file:
+            ## an empty file cannot be mapped
+            if not os.fstat(file.fileno()).st_size:
+                return b""
+            with mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as file_map:
+                ## a "\r\n" ending at most doubles the size of a line, so
+                ## twice the hint is enough to cover the translated lines
+                end = file_map.find(b"\n", 2 * max_lines)
+                if max_lines <= 0 or end == -1:
+                    data = file_map[:]
+                else:
+                    data = file_map[: end + 1]
+    except Exception:
+        return b""
+
+    # Translate newlines like a file opened in text mode
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if max_lines <= 0:
+        return data
+    end = data.find(b"\n", max_lines)
+    return data if end == -1 else data[: end + 1]
+
+
 def compute_lps(pattern: str) -> List[int]:
     """
     Compute the longest prefix suffix (LPS) array for the KMP algorithm.
@@ -365,7 +420,7 @@ def benchmark_algorithms(
         "Rabin-Karp Search": rabin_karp_search,
         "KMP Search": kmp_search,
         "Aho-Corasick Search": aho_corasick_search,
-        "Regex Search": regex_search,
+        "Regex Search": partial(regex_search, use_regex=True),
         "Binary Search": binary_search,
     }
 
@@ -13,7 +13,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     classifiers=[
         "Environment :: Console",
         "Intended Audience :: Developers",
@@ -26,11 +26,13 @@ setup(
     python_requires=">=3.9",
     extras_require={
         "benchmark": ["matplotlib", "weasyprint"],
+        "hyperscan": ["hyperscan"],
+        "inotify": ["inotify_simple"],
         "tests": ["pytest>=6.4.4", "pytest-cov==4.1.0"],
     },
     entry_points={
         "console_scripts": [
-            "fsearch=fsearch.__main__:main",
+            "fsearch=fsearch.cli:main",
             "fsearch.service=fsearch.service:main",
         ]
     },
@@ -1,13 +1,23 @@
+import os
+import sys
 import unittest
+from importlib.util import find_spec
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from fsearch.algorithms import (
     AhoCorasick,
+    _Haystack,
     aho_corasick_search,
     binary_search,
+    hyperscan_search,
     kmp_search,
+    naive_search,
     native_search,
     rabin_karp_search,
     regex_search,
+    search_many,
+    shift_or_search,
 )
 
 text = "Hello World\nThis is a test\nGoodbye World"
@@ -27,6 +37,19 @@ class TestNativeSearch(unittest.TestCase):
     def test_partial_match(self):
         self.assertFalse(native_search(text, partial_match))
 
+    def test_bytes(self):
+        self.assertTrue(native_search(text.encode(), b"This is a test"))
+        self.assertFalse(native_search(text.encode(), b"World"))
+
+    def test_naive_alias(self):
+        self.assertIs(naive_search, native_search)
+
+    def test_line_boundaries(self):
+        self.assertTrue(native_search(text, "Hello World"))
+        self.assertTrue(native_search(text, "Goodbye World"))
+        self.assertFalse(native_search(text, "World"))
+        self.assertFalse(native_search(text, "Hello World\nThis is a test"))
+
 
 class TestRegExSearch(unittest.TestCase):
     def test_search_match(self):
@@ -38,6 +61,17 @@ class TestRegExSearch(unittest.TestCase):
     def test_partial_match(self):
         self.assertFalse(regex_search(text, partial_match))
 
+    def test_use_regex(self):
+        self.assertTrue(regex_search(text, full_match, use_regex=True))
+        self.assertFalse(regex_search(text, false_match, use_regex=True))
+        self.assertFalse(regex_search(text, "World", use_regex=True))
+
+    def test_newline_pattern(self):
+        pattern = "Hello World\nThis is a test"
+        self.assertFalse(regex_search(text, pattern))
+        ## the anchored multi-line regex spans the consecutive lines
+        self.assertTrue(regex_search(text, pattern, use_regex=True))
+
 
 class TestRabinKarpSearch(unittest.TestCase):
     def test_search_match(self):
@@ -60,6 +94,12 @@ class TestKpmSearch(unittest.TestCase):
     def test_partial_match(self):
         self.assertFalse(kmp_search(text, partial_match))
 
+    def test_line_boundaries(self):
+        self.assertTrue(kmp_search("World\nHello World", "Hello World"))
+        self.assertTrue(kmp_search(text, "Goodbye World"))
+        self.assertFalse(kmp_search(text, "World"))
+        self.assertFalse(kmp_search(text, "Hello World\nThis is a test"))
+
 
 class TestAhoCorasickSearch(unittest.TestCase):
     def test_search_match(self):
@@ -72,6 +112,28 @@ class TestAhoCorasickSearch(unittest.TestCase):
         self.assertFalse(aho_corasick_search(text, partial_match))
 
 
+class TestShiftOrSearch(unittest.TestCase):
+    def test_search_match(self):
+        self.assertTrue(shift_or_search(text, full_match))
+
+    def test_no_match(self):
+        self.assertFalse(shift_or_search(text, false_match))
+
+    def test_line_boundaries(self):
+        self.assertTrue(shift_or_search(text, "Hello World"))
+        self.assertTrue(shift_or_search(text, "Goodbye World"))
+        self.assertFalse(shift_or_search(text, "World"))
+        self.assertFalse(shift_or_search(text.encode(), b"This is a"))
+
+    def test_empty_line(self):
+        for lines in ("a\n\nb", "\na", "a\nb"):
+            expected = native_search(lines, "")
+            self.assertEqual(shift_or_search(lines, ""), expected)
+            self.assertEqual(regex_search(lines, "", use_regex=True), expected)
+            self.assertEqual(binary_search(lines, ""), expected)
+            self.assertEqual(hyperscan_search(lines, ""), expected)
+
+
 class TestBinarySearch(unittest.TestCase):
     def test_search_match(self):
         self.assertTrue(binary_search(text, full_match))
@@ -83,6 +145,38 @@ class TestBinarySearch(unittest.TestCase):
         self.assertFalse(binary_search(text, partial_match))
 
 
+class TestHyperscanSearch(unittest.TestCase):
+    def test_missing_dependency(self):
+        with patch.dict(sys.modules, {"hyperscan": None}):
+            with self.assertRaises(ImportError):
+                hyperscan_search(text, full_match)
+
+    def test_without_database(self):
+        self.assertFalse(hyperscan_search(text, ""))
+        self.assertFalse(hyperscan_search(text, "Hello World\nThis is a test"))
+
+    @unittest.skipUnless(find_spec("hyperscan"), "hyperscan is not installed")
+    def test_search_match(self):
+        self.assertTrue(hyperscan_search(text, full_match))
+        self.assertFalse(hyperscan_search(text, false_match))
+        self.assertFalse(hyperscan_search(text, "World"))
+
+
+class TestHaystack(unittest.TestCase):
+    def test_contains(self):
+        haystack = _Haystack(text)
+        self.assertTrue(haystack.contains("is a"))
+        self.assertFalse(haystack.contains(false_match))
+
+    def test_contains_line(self):
+        haystack = _Haystack(text)
+        for line in text.split("\n"):
+            self.assertTrue(haystack.contains_line(line))
+        self.assertFalse(haystack.contains_line("World"))
+        self.assertFalse(haystack.contains_line(false_match))
+        self.assertFalse(haystack.contains_line("Hello World\nThis is a test"))
+
+
 class TestAhoCorasick(unittest.TestCase):
     def test_init(self):
         ac = AhoCorasick()
@@ -120,3 +214,42 @@ class TestAhoCorasick(unittest.TestCase):
 
         results = ac.search("ushers")
         assert results == [(2, "he"), (2, "hers")]
+
+    def test_empty_pattern_ignored(self):
+        ac = AhoCorasick(["", "a"])
+        assert ac.new_state == 1
+        assert ac.search("éa") == [(1, "a")]
+
+    def test_init_with_patterns(self):
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        assert ac.new_state == 9
+        assert ac.search("ushers") == [(2, "he"), (2, "hers")]
+
+
+class TestSearchMany(unittest.TestCase):
+    def test_hit_map(self):
+        results = search_many("ushers", ["he", "she", "his", "hers"])
+        assert results == {"he": True, "she": True, "his": False, "hers": True}
+
+    def test_empty_pattern(self):
+        assert search_many(text, ["", "World"]) == {"": False, "World": True}
+
+    def test_dump_and_load(self):
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "automaton.pkl")
+            ac.dump(path)
+            loaded = AhoCorasick.load(path)
+        assert loaded.search("ushers") == ac.search("ushers")
+        assert loaded.matches("ushers") == {"he", "she", "hers"}
+
+    def test_load_or_build(self):
+        patterns = ["he", "she", "his", "hers"]
+        with TemporaryDirectory() as tmp_dir:
+            built = AhoCorasick.load_or_build(patterns, tmp_dir)
+            assert len(os.listdir(tmp_dir)) == 1
+            with patch.object(AhoCorasick, "build_automaton") as mock_build:
+                cached = AhoCorasick.load_or_build(patterns, tmp_dir)
+            mock_build.assert_not_called()
+        assert cached.goto == built.goto
+        assert cached.search("ushers") == [(2, "he"), (2, "hers")]
@@ -0,0 +1,160 @@
+import argparse
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fsearch.cli import StartArgs, _LazyLogger, _parse_args, main
+
+
+@pytest.mark.usefixtures("config_file_cls")
+class TestFsearchMain(unittest.TestCase):
+    # @patch('fsearch.cli.argparse.ArgumentParser')
+    @patch("fsearch.cli.os")
+    @patch("fsearch.server.Server")
+    @patch("fsearch.cli.logger")
+    def test_start_subcommand(self, mock_logger, mock_server, mock_os):
+        testargs = ["fsearch", "start", "--config", self.config_file]  # type: ignore
+        with patch.object(sys, "argv", testargs):
+            with patch(
+                "argparse.ArgumentParser.parse_args",
+                return_value=StartArgs(
+                    subcommand="start", config="test_config.yaml"
+                ),
+            ) as mock_parse_args:
+                main()
+                # mock_argparse.add_subparsers.assert_called_once()
+                args = mock_parse_args.return_value
+                self.assertEqual(args.subcommand, "start")
+                mock_logger.debug.assert_called_once()
+                mock_os.path.abspath.assert_called_once()
+                mock_server().connect.assert_called_once()
+
+    @patch("fsearch.cli.logger")
+    def test_stop_subcommand(self, mock_logger):
+        testargs = ["fsearch", "stop"]
+        with patch.object(sys, "argv", testargs):
+            main()
+            mock_logger.debug.assert_called_with("Stopping the server")
+
+    @patch("fsearch.utils.create_sample")
+    @patch("fsearch.cli.logger")
+    def test_samples_subcommand(self, mock_logger, mock_create_sample):
+        testargs = ["fsearch", "samples", "--size", "10"]
+        with patch.object(sys, "argv", testargs):
+            main()
+            # mock_logger.debug.assert_called_with("Generating test sample file")
+            mock_create_sample.assert_called_with(10)
+
+    @patch("argparse.ArgumentParser.print_help")
+    @patch("fsearch.cli.logger")
+    def test_default_no_subcommand(self, mock_logger, mock_parser):
+        testargs = ["fsearch"]
+        with patch.object(sys, "argv", testargs):
+            with patch("argparse.ArgumentParser") as mock_parse_args:
+                mock_parse_args.return_value.parse_known_args.return_value = (
+                    argparse.Namespace(subcommand=None, help=False),
+                    [],
+                )
+                # with self.assertRaises(SystemExit):
+                main()
+                mock_parse_args.assert_called_once()
+                mock_parse_args.return_value.print_help.assert_called_once()
+
+    @patch("fsearch.cli.logger")
+    def test_subcommand_help(self, mock_logger):
+        testargs = ["fsearch", "samples", "-h"]
+        with patch.object(sys, "argv", testargs):
+            with self.assertRaises(SystemExit) as exit_info:
+                main()
+            self.assertEqual(exit_info.exception.code, 0)
+
+    @patch("fsearch.cli.logger")
+    def test_start_falls_back_to_argparse(self, mock_logger):
+        mock_start = MagicMock()
+        testargs = ["fsearch", "start", "--conf", self.config_file]  # type: ignore
+        with (
+            patch.object(sys, "argv", testargs),
+            patch.dict("fsearch.cli._COMMANDS", {"start": mock_start}),
+        ):
+            main()
+        args = mock_start.call_args.args[0]
+        self.assertEqual(args.subcommand, "start")
+        self.assertEqual(args.config, self.config_file)  # type: ignore
+        self.assertEqual(args.workers, 1)
+
+    @patch("fsearch.cli.logger")
+    def test_start_unknown_option(self, mock_logger):
+        testargs = ["fsearch", "start", "-c", "cfg.ini", "--bogus"]
+        with (
+            patch.object(sys, "argv", testargs),
+            patch("sys.stderr") as mock_stderr,
+        ):
+            with self.assertRaises(SystemExit) as exit_info:
+                main()
+        self.assertEqual(exit_info.exception.code, 2)
+        message = "".join(c.args[0] for c in mock_stderr.write.call_args_list)
+        self.assertIn("unrecognized arguments: --bogus", message)
+        self.assertNotIn("required", message)
+
+    @patch("fsearch.cli.logger")
+    def test_version_argument(self, mock_logger):
+        testargs = ["fsearch", "--version"]
+        with patch.object(sys, "argv", testargs):
+            with self.assertRaises(SystemExit):
+                main()
+
+    @patch("fsearch.utils.create_sample")
+    @patch("fsearch.cli.logger")
+    def test_fast_path_skips_argparse(self, mock_logger, mock_create_sample):
+        for testargs in (
+            ["fsearch", "stop"],
+            ["fsearch", "samples", "-s", "2"],
+        ):
+            with patch.object(sys, "argv", testargs):
+                with patch("argparse.ArgumentParser") as mock_parser:
+                    main()
+                    mock_parser.assert_not_called()
+        mock_logger.debug.assert_any_call("Stopping the server")
+        mock_create_sample.assert_called_once_with(2)
+
+
+class TestParseArgs(unittest.TestCase):
+    def test_parses_known_shapes(self):
+        args = _parse_args(["start", "--config", "config.ini"])
+        self.assertIsInstance(args, StartArgs)
+        self.assertEqual(args.config, "config.ini")
+        self.assertEqual(args.workers, 1)
+        args = _parse_args(["start", "-c", "config.ini", "-w", "4"])
+        self.assertEqual(args.workers, 4)
+        self.assertEqual(args.mode, "threads")
+        args = _parse_args(["start", "-c", "config.ini", "--mode", "async"])
+        self.assertEqual(args.mode, "async")
+
+        self.assertEqual(_parse_args(["samples"]).size, 1)
+        self.assertEqual(_parse_args(["samples", "-s", "3"]).size, 3)
+        self.assertEqual(_parse_args(["certs"]).dir, ".")
+
+    def test_falls_back_to_argparse(self):
+        for argv in (
+            [],
+            ["-h"],
+            ["start"],
+            ["start", "-h"],
+            ["samples", "-s"],
+            ["samples", "-s", "x"],
+            ["start", "-c", "config.ini", "-m", "bogus"],
+            ["bogus"],
+        ):
+            self.assertIsNone(_parse_args(argv), argv)
+
+
+class TestLazyLogger(unittest.TestCase):
+    def test_resolves_logger_on_first_use(self):
+        import logging
+
+        lazy_logger = _LazyLogger("fsearch.test")
+        self.assertIsNone(lazy_logger._logger)
+        self.assertEqual(lazy_logger.name, "fsearch.test")
+        self.assertIs(lazy_logger._logger, logging.getLogger("fsearch.test"))
@@ -0,0 +1,121 @@
+import socket
+import sys
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from fsearch.client import Client, main
+
+
+class TestClient(unittest.TestCase):
+    @patch("fsearch.client.socket.socket")
+    def test_init_connects_once(self, mock_socket):
+        mock_socket_inst = mock_socket.return_value
+        client = Client("127.0.0.1", 8080)
+
+        mock_socket.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
+        mock_socket_inst.setsockopt.assert_called_once_with(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+        mock_socket_inst.connect.assert_called_once_with(("127.0.0.1", 8080))
+        self.assertIsNone(client.ssl_context)
+
+    @patch("fsearch.client.socket.socket")
+    def test_send_message_reuses_socket(self, mock_socket):
+        mock_socket_inst = mock_socket.return_value
+        mock_socket_inst.recv.return_value = b"STRING EXISTS"
+        client = Client("127.0.0.1", 8080)
+
+        self.assertEqual(client.send_message("query"), "STRING EXISTS")
+        self.assertEqual(client.send_message("query"), "STRING EXISTS")
+
+        mock_socket.assert_called_once()
+        mock_socket_inst.connect.assert_called_once()
+        self.assertEqual(mock_socket_inst.sendall.call_count, 2)
+        mock_socket_inst.sendall.assert_called_with(b"query")
+
+    @patch("fsearch.client.socket.socket")
+    def test_each_reply_read_before_next_message(self, mock_socket):
+        mock_socket_inst = mock_socket.return_value
+        mock_socket_inst.recv.side_effect = [
+            b"STRING EXISTS",
+            b"STRING NOT FOUND",
+        ]
+        client = Client("127.0.0.1", 8080)
+
+        self.assertEqual(client.send_message("alpha"), "STRING EXISTS")
+        self.assertEqual(client.send_message("nope"), "STRING NOT FOUND")
+        ## the server never receives the messages as a single payload
+        self.assertEqual(
+            [name for name, _, _ in mock_socket_inst.method_calls[-4:]],
+            ["sendall", "recv", "sendall", "recv"],
+        )
+        self.assertEqual(
+            mock_socket_inst.sendall.call_args_list,
+            [call(b"alpha"), call(b"nope")],
+        )
+
+    @patch("fsearch.client.socket.socket")
+    def test_send_bytes(self, mock_socket):
+        mock_socket_inst = mock_socket.return_value
+        mock_socket_inst.recv.return_value = b"STRING NOT FOUND"
+        client = Client("127.0.0.1", 8080)
+
+        self.assertEqual(client.send_bytes(b"query"), b"STRING NOT FOUND")
+        mock_socket_inst.sendall.assert_called_once_with(b"query")
+
+    @patch("fsearch.client.socket.socket")
+    def test_send_message_error(self, mock_socket):
+        mock_socket_inst = mock_socket.return_value
+        mock_socket_inst.sendall.side_effect = OSError("broken pipe")
+        client = Client("127.0.0.1", 8080)
+
+        self.assertEqual(client.send_message("query"), "")
+
+    @patch("fsearch.client.socket.socket")
+    def test_context_manager_closes(self, mock_socket):
+        mock_socket_inst = mock_socket.return_value
+        with Client("127.0.0.1", 8080) as client:
+            self.assertIsInstance(client, Client)
+        mock_socket_inst.close.assert_called_once()
+
+    @patch("fsearch.client.os.path.exists", return_value=True)
+    @patch("fsearch.client.ssl.SSLContext")
+    @patch("fsearch.client.socket.socket")
+    def test_ssl_context_built_once(
+        self, mock_socket, mock_ssl_context, mock_exists
+    ):
+        mock_context = mock_ssl_context.return_value
+        client = Client(
+            "127.0.0.1", 8080, certfile="server.crt", keyfile="server.key"
+        )
+
+        mock_ssl_context.assert_called_once()
+        mock_context.load_cert_chain.assert_called_once_with(
+            "server.crt", "server.key"
+        )
+        mock_context.wrap_socket.assert_called_once_with(
+            mock_socket.return_value, server_hostname="127.0.0.1"
+        )
+        self.assertEqual(
+            client.client_socket, mock_context.wrap_socket.return_value
+        )
+
+    def test_missing_certfile(self):
+        with self.assertRaises(Exception):
+            Client("127.0.0.1", 8080, certfile="non_existent.crt")
+
+
+class TestClientMain(unittest.TestCase):
+    @patch("fsearch.client.Client")
+    def test_main(self, mock_client):
+        client = MagicMock()
+        client.send_message.return_value = "STRING EXISTS"
+        mock_client.return_value.__enter__.return_value = client
+        testargs = ["client.py", "-p", "8080", "query"]
+        with patch.object(sys, "argv", testargs):
+            main()
+
+        mock_client.assert_called_once_with(
+            "0.0.0.0", 8080, certfile=None, keyfile=None
+        )
+        client.send_message.assert_called_once_with("query")
@@ -34,3 +34,10 @@ class TestConfig:
             "custom_param1": "value1",
             "custom_param2": 12345,
         }
+
+    def test_string_values(self):
+        config = Config(port="9090", ssl="on", reread_on_query="1")
+        assert config.port == 9090
+        assert config.ssl is True
+        assert config.reread_on_query is True
+        assert Config(ssl="off").ssl is False
@@ -1,16 +1,38 @@
+import asyncio
+import logging
+import signal
 import socket
 import ssl
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, call, patch
 
 import pytest
 
 from fsearch.algorithms import regex_search
 from fsearch.config import Config
 from fsearch.server import Server
+from fsearch.server import logger as server_logger
 from fsearch.utils import generate_certs, logger, read_config, read_file
 
 
+def serve_in_thread(server):
+    """Runs `server.connect` on a free local port in a thread.
+
+    Returns the thread and the port once the server is listening.
+    """
+    server.configs.host, server.configs.port = "127.0.0.1", 0
+    thread = threading.Thread(target=server.connect, daemon=True)
+    thread.start()
+    for _ in range(100):
+        port = server.server_socket.getsockname()[1]
+        if port and server.is_running:
+            return thread, port
+        time.sleep(0.01)
+    raise AssertionError("server did not start")
+
+
 @pytest.mark.usefixtures("config_file_cls")
 class TestServer(unittest.TestCase):
     def setUp(self):
@@ -18,12 +40,12 @@ class TestServer(unittest.TestCase):
         self.mock_config = read_config(self.config_path)
         # self.server = Server(self.config_path)
 
-    @patch("fsearch.server.read_file")
+    @patch("fsearch.server.read_file_bytes")
     @patch("fsearch.server.read_config")
-    @patch("fsearch.server.ssl.wrap_socket")
+    @patch("fsearch.server.ssl.SSLContext")
     @patch("fsearch.server.socket.socket", spec=True)
     def test_init(
-        self, mock_socket, mock_wrap_socket, mock_read_config, mock_read_file
+        self, mock_socket, mock_ssl_context, mock_read_config, mock_read_file
     ):
         mock_read_config.return_value = self.mock_config
         server = Server(self.config_path)
@@ -34,18 +56,18 @@ class TestServer(unittest.TestCase):
         self.assertEqual(server.configs, self.mock_config)
         self.assertFalse(server.is_running)
         if server.configs.ssl:
-            mock_wrap_socket.assert_called_once()
+            mock_ssl_context.assert_called_once()
         self.assertEqual(server.database, mock_read_file.return_value)
         self.assertEqual(server.max_conn, 5)
 
     @patch("fsearch.server.generate_certs")
     @patch("fsearch.server.os.path.exists")
-    @patch("fsearch.server.ssl.wrap_socket")
+    @patch("fsearch.server.ssl.SSLContext")
     @patch("fsearch.server.read_config")
     def test_load_ssl(
         self,
         mock_read_config,
-        mock_wrap_socket,
+        mock_ssl_context,
         mock_exists,
         mock_generate_certs,
     ):
@@ -62,13 +84,21 @@ class TestServer(unittest.TestCase):
         server.configs.ssl = True
         try:
             server.load_ssl()
-            mock_wrap_socket.assert_called_once()
+            mock_ssl_context.assert_called_once_with(ssl.PROTOCOL_TLS_SERVER)
+            mock_ssl_context.return_value.load_cert_chain.assert_called_once_with(
+                "generated_certfile", "generated_keyfile"
+            )
+            self.assertEqual(server.ssl_context, mock_ssl_context.return_value)
+            self.assertEqual(
+                server.ssl_context.minimum_version, ssl.TLSVersion.TLSv1_2
+            )
+            server.ssl_context.set_ciphers.assert_called_once()
             self.assertEqual(server.configs.certfile, "generated_certfile")
             self.assertEqual(server.configs.keyfile, "generated_keyfile")
         except StopIteration:
             pass
 
-    @patch("fsearch.server.read_file")
+    @patch("fsearch.server.read_file_bytes")
     @patch("fsearch.server.read_config")
     def test_load_database(self, mock_read_config, mock_read_file):
         mock_read_config.return_value = self.mock_config
@@ -104,12 +134,26 @@ class TestServer(unittest.TestCase):
             assert server.is_running
             mock_sys_exit.assert_not_called()
 
+    @patch("asyncio.run")
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.socket.socket")
+    def test_connect_async(self, mock_socket, mock_read_config, mock_run):
+        mock_read_config.return_value = self.mock_config
+        server = Server(self.config_path, mode="async")
+        with (
+            patch.object(server, "receive") as mock_receive,
+            patch.object(server, "_serve", new=MagicMock()) as mock_serve,
+        ):
+            server.connect()
+            mock_run.assert_called_once_with(mock_serve.return_value)
+            mock_receive.assert_not_called()
+
     @patch("fsearch.server.Server", autospec=True, wraps=Server)
     @patch("fsearch.server.read_config")
     @patch("fsearch.server.socket.socket")
-    @patch("fsearch.server.threading.Thread")
+    @patch("fsearch.server.ThreadPoolExecutor")
     def test_receive(
-        self, mock_thread, mock_socket, mock_read_config, MockServer
+        self, mock_pool, mock_socket, mock_read_config, MockServer
     ):
         """Note: see https://deniscapeto.com/2021/03/06/how-to-test-a-while-true-in-python/ on test in a loop"""
         mock_read_config.return_value = self.mock_config
@@ -119,7 +163,6 @@ class TestServer(unittest.TestCase):
             mock_client_socket,
             mock_client_address,
         )
-        mock_thread.start.return_value = MagicMock()
 
         server = Server(self.config_path)
         sentinel = PropertyMock(side_effect=[True, False])
@@ -133,22 +176,27 @@ class TestServer(unittest.TestCase):
             patch.object(
                 server, "_handle_client", return_value=None
             ) as mock_handle_client,
+            patch.object(server, "_dispatch") as mock_dispatch,
             patch(
-                "fsearch.server.time.perf_counter", side_effect=0
+                "fsearch.server.time.perf_counter", return_value=0
             ) as mock_time,
         ):
             server.receive()
             mock_socket_inst.accept.assert_called_once()
             mock_time.assert_called_once()
+            mock_dispatch.assert_called_once()
+            mock_client_socket.setsockopt.assert_called_once_with(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
             self.assertTrue(
                 mock_load_database.called or not mock_load_database.called
             )
-            print(mock_thread.call_args)
-            """ mock_thread.assert_called_with(
-                    args=(mock_client_socket, mock_time, mock_client_address), 
-                    target=mock_handle_client
-                ) """
-            # mock_thread.start.assert_called_once()
+            mock_pool.return_value.submit.assert_called_once_with(
+                mock_handle_client,
+                mock_client_socket,
+                mock_time.return_value,
+                mock_client_address,
+            )
 
         print(sentinel.call_count)
         sentinel.reset_mock(side_effect=True, return_value=True)
@@ -157,21 +205,28 @@ class TestServer(unittest.TestCase):
     @patch("builtins.round")
     @patch("fsearch.server.read_config")
     @patch("fsearch.server.socket.socket")
-    @patch("fsearch.server.regex_search")
+    @patch("fsearch.server.read_file_bytes")
     def test_handle_client(
-        self, mock_regex_search, mock_socket, mock_read_config, mock_round
+        self, mock_read_file, mock_socket, mock_read_config, mock_round
     ):
         mock_read_config.return_value = self.mock_config
         mock_client_socket = MagicMock()
-        mock_regex_search.return_value = True
+        payloads = [b"query\x00", b""]
+
+        def recv_into(buffer):
+            payload = payloads.pop(0)
+            buffer[: len(payload)] = payload
+            return len(payload)
+
+        mock_client_socket.recv_into.side_effect = recv_into
+        mock_read_file.return_value = b"database contents\nquery"
         server = Server(self.config_path)
-        server.database = "database contents"
 
         with patch(
             "fsearch.server.time.perf_counter", side_effect=[0, 1]
         ) as mock_time:
             server._handle_client(mock_client_socket, 0, "client_address")
-            mock_client_socket.recv.assert_called_once()
+            self.assertEqual(mock_client_socket.recv_into.call_count, 2)
             mock_time.assert_called_once()
             mock_round.assert_called_once()
             mock_client_socket.sendall.assert_called_once_with(
@@ -179,6 +234,269 @@ class TestServer(unittest.TestCase):
             )
             # mock_client_socket.close.assert_called_once()
 
+    @patch("builtins.round")
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.read_file_bytes")
+    def test_handle_client_debug_off(
+        self, mock_read_file, mock_read_config, mock_round
+    ):
+        mock_read_config.return_value = self.mock_config
+        mock_client_socket = MagicMock()
+        payloads = [b"query", b""]
+
+        def recv_into(buffer):
+            payload = payloads.pop(0)
+            buffer[: len(payload)] = payload
+            return len(payload)
+
+        mock_client_socket.recv_into.side_effect = recv_into
+        mock_read_file.return_value = b"database contents\nquery"
+        server = Server(self.config_path, log_level="INFO")
+        self.addCleanup(server_logger.setLevel, logging.DEBUG)
+
+        with (
+            patch.object(server_logger, "debug") as mock_debug,
+            patch("fsearch.server.time.perf_counter") as mock_time,
+        ):
+            server._handle_client(mock_client_socket, None, "client_address")
+            mock_client_socket.sendall.assert_called_once_with(
+                b"STRING EXISTS"
+            )
+            mock_debug.assert_not_called()
+            mock_round.assert_not_called()
+            mock_time.assert_not_called()
+
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.read_file_bytes")
+    def test_handle_async(self, mock_read_file, mock_read_config):
+        mock_read_config.return_value = self.mock_config
+        mock_read_file.return_value = b"database contents\nquery"
+        server = Server(self.config_path, mode="async")
+        reader = MagicMock()
+        reader.read = AsyncMock(side_effect=[b"query\x00", b"nope", b""])
+        writer = MagicMock()
+        writer.drain = AsyncMock()
+
+        asyncio.run(server._handle_async(reader, writer))
+        self.assertEqual(
+            writer.write.call_args_list,
+            [call(b"STRING EXISTS"), call(b"STRING NOT FOUND")],
+        )
+        writer.close.assert_called_once()
+
+    @patch("fsearch.server.read_config")
+    def test_unknown_mode(self, mock_read_config):
+        mock_read_config.return_value = self.mock_config
+        with self.assertRaises(ValueError):
+            Server(self.config_path, mode="bogus")
+
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.socket.socket")
+    def test_handle_client_ssl(self, mock_socket, mock_read_config):
+        mock_read_config.return_value = self.mock_config
+        server = Server(self.config_path)
+        server.ssl_context = MagicMock()
+        mock_client_socket = MagicMock()
+        mock_tls_socket = server.ssl_context.wrap_socket.return_value
+        mock_tls_socket.recv_into.return_value = 0
+
+        server._handle_client(mock_client_socket, 0, "client_address")
+        server.ssl_context.wrap_socket.assert_called_once_with(
+            mock_client_socket, server_side=True, do_handshake_on_connect=False
+        )
+        mock_tls_socket.do_handshake.assert_called_once()
+        mock_tls_socket.recv_into.assert_called_once()
+        mock_client_socket.recv_into.assert_not_called()
+
+        server.ssl_context.wrap_socket.side_effect = ssl.SSLError("bad")
+        server._handle_client(mock_client_socket, 0, "client_address")
+        mock_client_socket.close.assert_called_once()
+
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.socket.socket")
+    def test_refresh_rereads_changed_config(
+        self, mock_socket, mock_read_config
+    ):
+        mock_read_config.return_value = self.mock_config
+        server = Server(self.config_path)
+        mock_read_config.reset_mock()
+
+        server._refresh()
+        mock_read_config.assert_not_called()
+
+        server._config_mtime = None
+        server._refresh()
+        mock_read_config.assert_called_once_with(self.config_path)
+
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.socket.socket")
+    def test_refresh_watched(self, mock_socket, mock_read_config):
+        mock_read_config.return_value = self.mock_config
+        server = Server(self.config_path)
+        server._dirty = threading.Event()
+        server._config_mtime = None
+        mock_read_config.reset_mock()
+
+        server.lineset = None
+        with (
+            patch.object(server, "_config_stamp") as mock_stamp,
+            patch.object(server, "load_database") as mock_load_database,
+        ):
+            server._refresh()
+            mock_stamp.assert_not_called()
+            mock_read_config.assert_not_called()
+            mock_load_database.assert_not_called()
+
+            server._dirty.set()
+            with patch.object(server, "_add_watches") as mock_add_watches:
+                server._refresh()
+            self.assertFalse(server._dirty.is_set())
+            mock_read_config.assert_called_once_with(self.config_path)
+            mock_add_watches.assert_called_once()
+
+    @patch.dict("sys.modules", {"inotify_simple": None})
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.socket.socket")
+    def test_watch_without_inotify(self, mock_socket, mock_read_config):
+        mock_read_config.return_value = self.mock_config
+        server = Server(self.config_path)
+        server._watch()
+        self.assertIsNone(server._dirty)
+
+    @patch("fsearch.server.os.waitpid")
+    @patch("fsearch.server.os.kill")
+    @patch("fsearch.server.os.fork", side_effect=[101, 102])
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.socket.socket")
+    def test_fork_workers(
+        self, mock_socket, mock_read_config, mock_fork, mock_kill, mock_wait
+    ):
+        mock_read_config.return_value = self.mock_config
+        server = Server(self.config_path, workers=3)
+
+        server._fork_workers()
+        self.assertEqual(mock_fork.call_count, 2)
+        self.assertEqual(server._children, [101, 102])
+
+        server.stop()
+        mock_kill.assert_has_calls(
+            [call(101, signal.SIGTERM), call(102, signal.SIGTERM)]
+        )
+        self.assertEqual(mock_wait.call_count, 2)
+        self.assertEqual(server._children, [])
+
+    @patch("fsearch.server.os.fork", return_value=0)
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.socket.socket")
+    def test_fork_workers_child(
+        self, mock_socket, mock_read_config, mock_fork
+    ):
+        mock_read_config.return_value = self.mock_config
+        server = Server(self.config_path, workers=3)
+
+        server._fork_workers()
+        mock_fork.assert_called_once()
+        self.assertEqual(server._children, [])
+
+    @patch.object(Server, "is_running", False)
+    @patch.object(Server, "max_workers", 2)
+    def test_idle_clients_do_not_hold_workers(self):
+        server = Server(self.config_path, max_conn=1, log_level="INFO")
+        ## the pool is not sized by the number of connections
+        self.assertEqual(server._pool._max_workers, 2)
+        thread, port = serve_in_thread(server)
+        clients = []
+        try:
+            ## more silent clients than pooled threads
+            for _ in range(server._pool._max_workers + 2):
+                clients.append(socket.create_connection(("127.0.0.1", port)))
+            ## more idle keep-alive clients than pooled threads
+            for _ in range(server._pool._max_workers + 4):
+                client = socket.create_connection(("127.0.0.1", port))
+                client.settimeout(3)
+                client.sendall(b"nope")
+                self.assertEqual(client.recv(64), b"STRING NOT FOUND")
+                clients.append(client)
+            clients[0].sendall(b"nope")
+            self.assertEqual(clients[0].recv(64), b"STRING NOT FOUND")
+        finally:
+            for client in clients:
+                client.close()
+            server.stop()
+        thread.join(3)
+        self.assertFalse(thread.is_alive())
+
+    @patch.object(Server, "is_running", False)
+    def test_stop_with_connected_client(self):
+        server = Server(self.config_path, log_level="INFO")
+        thread, port = serve_in_thread(server)
+        with socket.create_connection(("127.0.0.1", port)) as client:
+            client.settimeout(3)
+            client.sendall(b"nope")
+            self.assertEqual(client.recv(64), b"STRING NOT FOUND")
+
+            server.stop()
+            thread.join(3)
+            self.assertFalse(thread.is_alive())
+            ## the pool threads are joined at exit, they must all end
+            for worker in list(server._pool._threads):
+                worker.join(3)
+                self.assertFalse(worker.is_alive())
+            self.assertEqual(client.recv(64), b"")
+            self.assertEqual(server._clients, set())
+
+    @patch.object(Server, "is_running", False)
+    def test_stop_async(self):
+        server = Server(self.config_path, mode="async", log_level="INFO")
+        thread, port = serve_in_thread(server)
+        for _ in range(100):
+            if server._loop is not None:
+                break
+            time.sleep(0.01)
+        with socket.create_connection(("127.0.0.1", port)) as client:
+            client.settimeout(3)
+            client.sendall(b"nope")
+            self.assertEqual(client.recv(64), b"STRING NOT FOUND")
+
+            server.stop()
+            thread.join(3)
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(client.recv(64), b"")
+            self.assertIsNone(server._loop)
+
+    def test_serve_cancelled(self):
+        server = Server(self.config_path, mode="async", log_level="INFO")
+        server.server_socket.bind(("127.0.0.1", 0))
+        server.server_socket.listen()
+
+        async def interrupt():
+            task = asyncio.create_task(server._serve())
+            while server._async_server is None:
+                await asyncio.sleep(0.01)
+            ## as asyncio.run does on a KeyboardInterrupt
+            task.cancel()
+            await task
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(interrupt())
+        self.assertIsNone(server._loop)
+
+    def test_serve_stopped_while_starting(self):
+        server = Server(self.config_path, mode="async", log_level="INFO")
+        server.server_socket.bind(("127.0.0.1", 0))
+        server.server_socket.listen()
+        start_server = asyncio.start_server
+
+        async def stopped_start(*args, **kwargs):
+            ## the stop lands before the asyncio server is returned
+            server._stop_async()
+            return await start_server(*args, **kwargs)
+
+        with patch("asyncio.start_server", stopped_start):
+            asyncio.run(asyncio.wait_for(server._serve(), 3))
+        self.assertIsNone(server._loop)
+        self.assertFalse(server._async_server.is_serving())
+
     @patch("fsearch.server.Server", autospec=True, wraps=Server)
     @patch("fsearch.server.read_config")
     @patch("fsearch.server.socket.socket")
@@ -189,7 +507,11 @@ class TestServer(unittest.TestCase):
         mock_socket_inst = mock_socket.return_value
         sentinel = PropertyMock(return_value=False)
         Server.is_running = sentinel
+        server._pool = MagicMock()
         server.stop()
+        server._pool.shutdown.assert_called_once_with(
+            wait=False, cancel_futures=True
+        )
         print("stop.is_running.call_count", sentinel.call_count)
         self.assertFalse(server.is_running)
         mock_socket_inst.shutdown.assert_called_once_with(socket.SHUT_RDWR)
@@ -198,13 +520,49 @@ class TestServer(unittest.TestCase):
         MockServer.stop()
 
     @patch("fsearch.server.read_config")
-    @patch("fsearch.server.regex_search")
-    def test_search(self, mock_regex_search, mock_read_config):
+    @patch("fsearch.server.read_file_bytes")
+    def test_search(self, mock_read_file, mock_read_config):
+        mock_read_config.return_value = self.mock_config
+        mock_read_file.return_value = b"database contents\nquery"
+        server = Server(self.config_path)
+
+        self.assertEqual(
+            server.lineset, frozenset({b"database contents", b"query"})
+        )
+        self.assertEqual(server.search("query"), "STRING EXISTS")
+        self.assertEqual(server.search("database"), "STRING NOT FOUND")
+        self.assertIs(server._respond(b"query"), Server.FOUND)
+        self.assertIs(server._respond(b"database"), Server.NOT_FOUND)
+
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.read_file_bytes")
+    def test_load_database_unchanged(self, mock_read_file, mock_read_config):
+        self.mock_config.reread_on_query = True
+        mock_read_config.return_value = self.mock_config
+        mock_read_file.return_value = b"database contents\nquery"
+        with patch.object(
+            Server, "_database_stamp", return_value=("db", 1, 2)
+        ) as mock_stamp:
+            server = Server(self.config_path)
+            self.assertIsNone(server.lineset)
+
+            server.load_database()
+            mock_read_file.assert_called_once()
+            self.assertIsNone(server.lineset)
+
+            mock_stamp.return_value = ("db", 3, 2)
+            server.load_database()
+            self.assertEqual(mock_read_file.call_count, 2)
+            self.assertIsNone(server.lineset)
+
+    @patch("fsearch.server.read_config")
+    @patch("fsearch.server.read_file_bytes")
+    def test_search_reread_on_query(self, mock_read_file, mock_read_config):
+        self.mock_config.reread_on_query = True
         mock_read_config.return_value = self.mock_config
-        mock_regex_search.return_value = True
+        mock_read_file.return_value = b"database contents\nquery"
         server = Server(self.config_path)
-        server.database = "database contents"
 
-        result = server.search("query")
-        self.assertEqual(result, "STRING EXISTS")
-        mock_regex_search.assert_called_once_with("database contents", "query")
+        self.assertIsNone(server.lineset)
+        self.assertEqual(server.search("query"), "STRING EXISTS")
+        self.assertEqual(server.search("database"), "STRING NOT FOUND")
@@ -18,6 +18,7 @@ from fsearch.utils import (
     print_benchmarks,
     read_config,
     read_file,
+    read_file_bytes,
 )
 
 
@@ -78,6 +79,32 @@ class TestReadFile(unittest.TestCase):
         mock_open.assert_called_once_with(filepath, "r")
 
 
+class TestReadFileBytes(unittest.TestCase):
+    def test_read_file_bytes(self):
+        with TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "test.txt")
+            with open(filepath, "w") as file:
+                file.write("line1\nline2\nline3")
+
+            self.assertEqual(read_file_bytes(filepath), b"line1\nline2\nline3")
+            for max_lines in (0, 3, 6, 7):
+                self.assertEqual(
+                    read_file_bytes(filepath, max_lines),
+                    read_file(filepath, max_lines).encode(),
+                )
+
+    def test_read_file_bytes_empty(self):
+        with TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "empty.txt")
+            open(filepath, "w").close()
+            self.assertEqual(read_file_bytes(filepath), b"")
+
+    @patch("os.path.isfile", return_value=False)
+    def test_read_file_bytes_not_found(self, mock_isfile):
+        with self.assertRaises(FileNotFoundError):
+            read_file_bytes("non_existent.txt")
+
+
 class TestComputeLPS(unittest.TestCase):
     def test_empty_pattern(self):
         pattern = ""